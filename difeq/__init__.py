@@ -0,0 +1,10 @@
+"""
+Numerical and symbolic ODE solvers.
+
+Importing the package or any of its modules does no computation, and
+SymPy and matplotlib are only imported by the functions that need them.
+The former scripts are available as subcommands of the `difeq` command
+(see difeq.cli), or as `python -m difeq.<module>`.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,299 @@
+import math
+
+import numpy as np
+
+def companion_matrices(coefficients):
+    """
+    Companion matrices of a stack of constant-coefficient linear ODEs.
+
+    Row i of `coefficients` holds [a_n, ..., a_1, a_0] for
+    a_n y^(n) + ... + a_1 y' + a_0 y = 0, i.e. the characteristic polynomial
+    with the highest power first (the np.roots convention). The matrix acts on
+    the state [y, y', ..., y^(n-1)], so its eigenvalues are the roots of the
+    characteristic polynomial.
+
+    Parameters:
+    - coefficients: Array of shape (n_equations, n + 1), or (n + 1,) for one equation
+
+    Returns:
+    - Array of shape (n_equations, n, n), or (n, n) for one equation
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    c = np.atleast_2d(coefficients)
+    n = c.shape[1] - 1
+    A = np.zeros((c.shape[0], n, n))
+    A[:, np.arange(n - 1), np.arange(1, n)] = 1
+    A[:, -1, :] = -c[:, :0:-1] / c[:, :1]
+    return A if coefficients.ndim == 2 else A[0]
+
+def characteristic_roots(coefficients):
+    """
+    Roots of a stack of characteristic polynomials, as the eigenvalues of
+    their companion matrices computed in one batched call.
+
+    Parameters:
+    - coefficients: Array of shape (n_equations, n + 1), highest power first
+
+    Returns:
+    - Complex array of shape (n_equations, n)
+    """
+    return np.linalg.eigvals(companion_matrices(coefficients)).astype(complex)
+
+def _components(close):
+    # Connected components (transitive closure) of a stack of symmetric
+    # "close" relations, shape (rows, n, n); every root is labelled with the
+    # smallest index in its component
+    labels = np.broadcast_to(np.arange(close.shape[-1]), close.shape[:-1])
+    while True:
+        merged = np.where(close, labels[:, None, :], close.shape[-1]).min(axis=2)
+        if np.array_equal(merged, labels):
+            return labels
+        labels = merged
+
+def _poly_from_roots(roots):
+    # np.poly for every row at once
+    c = np.ones((roots.shape[0], 1), dtype=complex)
+    for k in range(roots.shape[1]):
+        c = np.pad(c, ((0, 0), (0, 1))) - roots[:, k:k + 1] * np.pad(c, ((0, 0), (1, 0)))
+    return c
+
+def _taylor(coefficients, z):
+    # Taylor coefficients t_j = p^(j)(z)/j! of every row's polynomial at
+    # every point of that row, shape (rows, points, degree + 1), and the
+    # rounding error bound of evaluating them (Horner, gamma_2n)
+    n = coefficients.shape[1] - 1
+    ascending = coefficients[:, ::-1]
+    k = np.arange(n + 1)
+    binom = np.array([[math.comb(i, j) for j in k] for i in k], dtype=float)
+    shift = np.maximum(k[:, None] - k[None, :], 0)
+    powers = z[..., None, None] ** shift
+    t = np.einsum("rk,kj,rikj->rij", ascending, binom, powers)
+    noise = np.einsum("rk,kj,rikj->rij", np.abs(ascending), binom, np.abs(powers))
+    return t, 2 * (n + 1) * np.finfo(float).eps * noise
+
+def _is_multiple_root(coefficients, mean, m, delta):
+    # A true m-fold root r has Taylor coefficients t_j = binom(m, j) t_m
+    # (r - mean)^(m-j) at the cluster mean, so |t_j| for j < m is bounded by
+    # that with |r - mean| <= delta plus the rounding error of evaluating t_j;
+    # a cluster of distinct roots d apart leaves t_j of order d^(m-j) instead
+    n = coefficients.shape[1] - 1
+    t, noise = _taylor(coefficients, mean)
+    j = np.arange(n + 1)
+    t_m = np.abs(np.take_along_axis(t, m[..., None], axis=2))
+    binom = np.array([[math.comb(i, jj) for jj in j] for i in j], dtype=float)[m]
+    bound = binom * t_m * delta[..., None] ** np.maximum(m[..., None] - j, 0) + noise
+    return np.all((np.abs(t) <= bound) | (j >= m[..., None]), axis=2)
+
+def classify_roots(roots, tol=1e-5, coefficients=None):
+    """
+    Groups numerically computed roots into distinct roots with multiplicity.
+
+    The eigenvalues of an m-fold root scatter around it by about eps^(1/m),
+    so closeness alone cannot decide multiplicity. Roots are grouped into
+    connected components of "closer than a threshold", starting from the
+    widest threshold 10 eps^(1/n) and narrowing down to tol; a component
+    of m roots is accepted as one m-fold root when the polynomial's Taylor
+    coefficients at the component mean vanish, up to rounding, as an m-fold
+    root requires (see _is_multiple_root), and is otherwise split at the next
+    threshold. Accepted roots are replaced by the component mean, which is
+    much more accurate than the individual eigenvalues. Every level works on
+    all equations at once.
+
+    Parameters:
+    - roots: Complex array of shape (n_equations, n)
+    - tol: Relative distance below which roots are always merged
+    - coefficients: Characteristic polynomials, highest power first (default:
+      rebuilt from the roots)
+
+    Returns:
+    - values: The cluster mean of every root, shape (n_equations, n)
+    - multiplicity: Multiplicity of every root, shape (n_equations, n)
+    - is_real: Whether every root is real
+    - leading: Mask selecting one entry per distinct real root and per
+      complex conjugate pair (the one with positive imaginary part)
+    """
+    roots = np.atleast_2d(roots).astype(complex)
+    n = roots.shape[1]
+    if coefficients is None:
+        coefficients = _poly_from_roots(roots)
+    coefficients = np.atleast_2d(coefficients).astype(complex)
+    eps = np.finfo(float).eps
+    thresholds = sorted({max(tol, 10 * eps ** (1 / k)) for k in range(1, n + 1)}, reverse=True)
+    values = roots.copy()
+    multiplicity = np.ones(roots.shape, dtype=int)
+    first = np.ones(roots.shape, dtype=bool)
+
+    index = np.arange(n)
+    scale = np.maximum(1, np.abs(roots))
+    distance = np.abs(roots[:, :, None] - roots[:, None, :])
+    resolved = np.zeros(roots.shape, dtype=bool)
+    group = np.zeros(roots.shape, dtype=int)
+    for threshold in thresholds:
+        # Unresolved roots are only split further within their previous component
+        active = ~resolved
+        close = ((distance < threshold * scale[:, :, None]) & (group[:, :, None] == group[:, None, :])
+                 & active[:, :, None] & active[:, None, :])
+        close |= close.transpose(0, 2, 1) | (index[:, None] == index[None, :])
+        group = _components(close)
+        members = (group[:, :, None] == group[:, None, :]) & active[:, None, :]
+        size = np.count_nonzero(members, axis=2)
+        mean = (members @ roots[:, :, None])[..., 0] / np.maximum(size, 1)
+        delta = tol * np.maximum(1, np.abs(mean))
+        accept = active & ((size == 1) | _is_multiple_root(coefficients, mean, size, delta))
+        values = np.where(accept, mean, values)
+        multiplicity = np.where(accept, size, multiplicity)
+        first &= ~accept | (index == group)
+        resolved |= accept
+
+    scale = np.maximum(1, np.abs(values))
+    is_real = np.abs(values.imag) < tol * scale
+    values = np.where(is_real, values.real, values)
+    leading = first & (is_real | (values.imag > 0))
+    return values, multiplicity, is_real, leading
+
+def general_solution_structure(coefficients, tol=1e-5):
+    """
+    Structure of the general solution of many constant-coefficient ODEs.
+
+    Parameters:
+    - coefficients: Array of shape (n_equations, n + 1), highest power first
+    - tol: Tolerance used to merge repeated roots (see classify_roots)
+
+    Returns:
+    - A list with, for each equation, a list of (alpha, beta, multiplicity)
+      terms: a real root r gives (r, 0, m) and contributes x^j e^(r x) for
+      j < m; a complex pair alpha +- i beta gives (alpha, beta, m) and
+      contributes x^j e^(alpha x) cos(beta x) and x^j e^(alpha x) sin(beta x).
+
+    Examples (multiplicities of the distinct roots; run with python -m doctest):
+    >>> rows = [[-1] * 4 + [3], [2] * 4 + [0], [0.5] * 5, [1, 1, 1, 1, 2], [1, 1.001, 3, 4, 5]]
+    >>> [sorted(m for *_, m in terms) for terms in general_solution_structure([np.poly(r) for r in rows])]
+    [[1, 4], [1, 4], [5], [1, 4], [1, 1, 1, 1, 1]]
+    """
+    coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+    values, multiplicity, _, leading = classify_roots(characteristic_roots(coefficients), tol,
+                                                      coefficients)
+    rows, cols = np.nonzero(leading)
+    structure = [[] for _ in range(values.shape[0])]
+    for i, j in zip(rows, cols):
+        r = values[i, j]
+        structure[i].append((float(r.real), float(abs(r.imag)), int(multiplicity[i, j])))
+    return structure
+
+def linear_propagator(coefficients, x0, state0, xs, method="auto", block=1024):
+    """
+    Numerically evaluates the solution of a constant-coefficient linear ODE
+    a_n y^(n) + ... + a_1 y' + a_0 y = 0 on a grid, without SymPy.
+
+    The state s = [y, y', ..., y^(n-1)] satisfies s' = A s with A the
+    companion matrix, so s(x) = exp(A (x - x0)) s(x0). On a uniform grid
+    P = exp(A dx) is computed once: the first `block` points are propagated
+    by P and later blocks by exp(A dx block), so each point costs one small
+    matrix product. Otherwise, when A has a well-conditioned
+    eigendecomposition A = V diag(l) V^-1, all points are evaluated at once
+    as V (exp(l (x - x0)) * V^-1 s(x0)); failing that, expm is evaluated for
+    every point in one batched call.
+
+    Parameters:
+    - coefficients: [a_n, ..., a_1, a_0], highest derivative first
+    - x0: x value of the initial state
+    - state0: Initial state [y(x0), y'(x0), ..., y^(n-1)(x0)]
+    - xs: Sorted grid of x values
+    - method: "auto", "eig" (always use the eigendecomposition) or "expm"
+      (never use it)
+    - block: Number of points propagated step by step on uniform grids
+
+    Returns:
+    - Array of shape (len(xs), n); column k holds the k-th derivative of y
+    """
+    from scipy.linalg import expm
+
+    if method not in ("auto", "eig", "expm"):
+        raise ValueError(f"unknown method {method!r}, expected 'auto', 'eig' or 'expm'")
+    A = companion_matrices(coefficients)
+    s0 = np.asarray(state0, dtype=float)
+    xs = np.asarray(xs, dtype=float)
+    dx = xs - x0
+    steps = np.diff(xs)
+    uniform = len(steps) > 0 and np.allclose(steps, steps[0], rtol=1e-9, atol=0)
+
+    if method == "eig" or (method == "auto" and not uniform):
+        lam, V = np.linalg.eig(A)
+        if method == "eig" or np.linalg.cond(V) < 1e8:
+            c = np.linalg.solve(V, s0.astype(complex))
+            return ((np.exp(np.outer(dx, lam)) * c) @ V.T).real
+    if not uniform:
+        return np.einsum("kij,j->ki", expm(A[None] * dx[:, None, None]), s0)
+
+    states = np.empty((len(xs), len(s0)))
+    h = steps[0]
+    states[0] = expm(A * dx[0]) @ s0
+    P = expm(A * h)
+    block = min(block, len(xs))
+    for i in range(1, block):
+        states[i] = P @ states[i - 1]
+    P_block = expm(A * (h * block)).T
+    for start in range(block, len(xs), block):
+        stop = min(start + block, len(xs))
+        states[start:stop] = states[start - block:stop - block] @ P_block
+    return states
+
+def build_general_solution(terms, x, decimals=6):
+    """
+    SymPy general solution for one entry of general_solution_structure.
+
+    Parameters:
+    - terms: List of (alpha, beta, multiplicity) terms
+    - x: SymPy symbol of the independent variable
+    - decimals: Number of decimals the roots are rounded to
+
+    Returns:
+    - The general solution, with constants C1, C2, ...
+    """
+    import sympy as sp
+
+    n = sum(m * (1 if beta == 0 else 2) for _, beta, m in terms)
+    C = sp.symbols(f"C1:{n + 1}")
+    i = 0
+    solution = 0
+    for alpha, beta, m in terms:
+        alpha, beta = round(alpha, decimals), round(beta, decimals)
+        for j in range(m):
+            if beta == 0:
+                solution += C[i] * x**j * sp.exp(alpha * x)
+                i += 1
+            else:
+                solution += x**j * sp.exp(alpha * x) * (C[i] * sp.cos(beta * x) + C[i + 1] * sp.sin(beta * x))
+                i += 2
+    return solution
+
+def main():
+    import sympy as sp
+    from sympy import symbols, Function, Eq
+
+    from .symcache import cached_call
+
+    # Define the differential equation using SymPy
+    x = symbols('x')
+    y = Function('y')(x)
+
+    # Define the differential equation
+    diffeq = Eq(y.diff(x, 4) + 3*y.diff(x, 3) - 2*y.diff(x, 2) - 4*y.diff(x) + 0.5*y, 0)
+
+    # Display the differential equation
+    print("Differential Equation:")
+    print(sp.pretty(diffeq))
+
+    # Solve the characteristic equation numerically
+    coefficients = [1, 3, -2, -4, 0.5]
+    terms = general_solution_structure([coefficients])[0]
+
+    # Construct the general solution symbolically
+    general_solution = cached_call(build_general_solution, terms, x)
+
+    # Display the general solution
+    print("\nGeneral Solution:")
+    print(sp.pretty(sp.Eq(y, general_solution)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+
+from .dense import HermiteSolution
+
+# a: stage coefficients (s x s, strictly lower triangular), b: weights,
+# c: nodes, b_hat: embedded lower-order weights (or None), fsal: the last
+# stage is f at the new point and can be reused as the next first stage
+Tableau = namedtuple("Tableau", "name order a b c b_hat fsal")
+
+def tableau(name, order, a, b, c, b_hat=None):
+    """
+    Builds a Tableau for an explicit Runge-Kutta method.
+
+    Parameters:
+    name  : Name of the method
+    order : Order of the weights b
+    a     : Stage coefficients, a square strictly lower triangular nested list
+    b     : Weights
+    c     : Nodes
+    b_hat : Weights of an embedded lower-order method (optional)
+
+    Returns:
+    The Tableau, with all coefficients as float arrays
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    c = np.array(c, dtype=float)
+    b_hat = None if b_hat is None else np.array(b_hat, dtype=float)
+    fsal = bool(c[-1] == 1 and np.array_equal(a[-1], b))
+    return Tableau(name, order, a, b, c, b_hat, fsal)
+
+def tableau_key(tableau):
+    """
+    Hash of the coefficients a, b and c of a tableau, for caches keyed by
+    the method: tableaux that share a name never share an entry.
+    """
+    digest = hashlib.sha256()
+    for coefficients in (tableau.a, tableau.b, tableau.c):
+        coefficients = np.asarray(coefficients, dtype=float)
+        digest.update(repr(coefficients.shape).encode() + coefficients.tobytes())
+    return digest.hexdigest()
+
+EULER = tableau("euler", 1, [[0]], [1], [0])
+
+# Heun's method, the "improved Euler" method of imp_euler.py
+HEUN = tableau("heun", 2, [[0, 0], [1, 0]], [1/2, 1/2], [0, 1], b_hat=[1, 0])
+
+RK4 = tableau(
+    "rk4", 4,
+    [[0, 0, 0, 0],
+     [1/2, 0, 0, 0],
+     [0, 1/2, 0, 0],
+     [0, 0, 1, 0]],
+    [1/6, 1/3, 1/3, 1/6],
+    [0, 1/2, 1/2, 1],
+)
+
+RK38 = tableau(
+    "rk38", 4,
+    [[0, 0, 0, 0],
+     [1/3, 0, 0, 0],
+     [-1/3, 1, 0, 0],
+     [1, -1, 1, 0]],
+    [1/8, 3/8, 3/8, 1/8],
+    [0, 1/3, 2/3, 1],
+)
+
+# Dormand-Prince 5(4): b is the fifth-order solution, b_hat the fourth-order one
+DOPRI54 = tableau(
+    "dopri54", 5,
+    [[0, 0, 0, 0, 0, 0, 0],
+     [1/5, 0, 0, 0, 0, 0, 0],
+     [3/40, 9/40, 0, 0, 0, 0, 0],
+     [44/45, -56/15, 32/9, 0, 0, 0, 0],
+     [19372/6561, -25360/2187, 64448/6561, -212/729, 0, 0, 0],
+     [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0, 0],
+     [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0]],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0],
+    [0, 1/5, 3/10, 4/5, 8/9, 1, 1],
+    b_hat=[5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40],
+)
+
+TABLEAUX = {t.name: t for t in (EULER, HEUN, RK4, RK38, DOPRI54)}
+
+def _nonzero(row):
+    return [(j, float(coef)) for j, coef in enumerate(row) if coef != 0]
+
+def _explicit_rk_scalar(f, xs, y, h, stages, weights, c, fsal, args, ys, fs):
+    # Same scheme on Python floats, which is much cheaper than 0-d arrays
+    steps = len(xs) - 1
+    xs = xs.tolist()
+    c = [h * c_i for c_i in c.tolist()]
+    stages = [[(j, h * a_ij) for j, a_ij in row] for row in stages]
+    weights = [(i, h * b_i) for i, b_i in weights]
+    K = [0.0] * len(c)
+
+    K[0] = f(xs[0], y, *args)
+    for n in range(steps):
+        x = xs[n]
+        if fs is not None:
+            fs[n] = K[0]
+        for i in range(1, len(c)):
+            y_stage = y
+            for j, ha_ij in stages[i]:
+                y_stage += ha_ij * K[j]
+            K[i] = f(x + c[i], y_stage, *args)
+        for i, hb_i in weights:
+            y += hb_i * K[i]
+        ys[n + 1] = y
+        if n + 1 < steps:
+            K[0] = K[-1] if fsal else f(xs[n + 1], y, *args)
+    if fs is not None:
+        fs[steps] = K[-1] if fsal and steps else f(xs[steps], y, *args)
+
+def _explicit_rk_symbolic(expr, x0, y0, h, steps, tableau, args, dense):
+    # A SymPy right-hand side runs as one generated, fused step per call
+    from .symcompile import compile_rhs, rk_step_kernel
+    if args:
+        raise ValueError("args are not supported for a SymPy right-hand side")
+    step = rk_step_kernel(expr, tableau, scalar=y0.ndim == 0)
+    xs = x0 + h * np.arange(steps + 1)
+    ys = np.empty((steps + 1,) + y0.shape)
+    ys[0] = y0
+    y = float(y0) if y0.ndim == 0 else y0
+    for n, x in enumerate(xs[:-1].tolist()):
+        y = step(x, y, h)
+        ys[n + 1] = y
+    fs = None
+    if dense:
+        x_col = xs.reshape((-1,) + (1,) * y0.ndim)
+        fs = np.broadcast_to(compile_rhs(expr)(x_col, ys), ys.shape).astype(float)
+    return xs, ys, fs
+
+def _explicit_rk(f, x0, y0, h, steps, tableau, args, dense, stats=None):
+    if isinstance(tableau, str):
+        tableau = TABLEAUX[tableau]
+    if stats is None:
+        return _explicit_rk_run(f, x0, y0, h, steps, tableau, args, dense)
+    with stats.phase("total"):
+        if hasattr(f, "free_symbols"):
+            # The stages are fused into one generated call per step
+            stats.nfev += steps * len(tableau.c)
+        else:
+            f = stats.count_rhs(f)
+        out = _explicit_rk_run(f, x0, y0, h, steps, tableau, args, dense)
+    stats.naccept += steps
+    return out
+
+def _explicit_rk_run(f, x0, y0, h, steps, tableau, args, dense):
+    if hasattr(f, "free_symbols"):
+        return _explicit_rk_symbolic(f, x0, np.asarray(y0, dtype=float), h, steps,
+                                     tableau, args, dense)
+    y0 = np.asarray(y0, dtype=float)
+    stages = [_nonzero(row[:i]) for i, row in enumerate(tableau.a)]
+    weights = _nonzero(tableau.b)
+    c = tableau.c
+
+    xs = x0 + h * np.arange(steps + 1)
+    ys = np.empty((steps + 1,) + y0.shape)
+    fs = np.empty_like(ys) if dense else None
+    ys[0] = y0
+    if y0.ndim == 0:
+        _explicit_rk_scalar(f, xs, float(y0), h, stages, weights, c,
+                            tableau.fsal, args, ys, fs)
+        return xs, ys, fs
+
+    K = np.empty((len(c),) + y0.shape)
+    y_stage = np.empty(y0.shape)
+    K[0] = f(xs[0], ys[0], *args)
+    for n in range(steps):
+        x = xs[n]
+        y = ys[n]
+        if dense:
+            fs[n] = K[0]
+        for i in range(1, len(c)):
+            y_stage[...] = y
+            for j, a_ij in stages[i]:
+                y_stage += (h * a_ij) * K[j]
+            K[i] = f(x + c[i] * h, y_stage, *args)
+
+        y_next = ys[n + 1]
+        y_next[...] = y
+        for i, b_i in weights:
+            y_next += (h * b_i) * K[i]
+
+        if n + 1 < steps:
+            if tableau.fsal:
+                K[0] = K[-1]
+            else:
+                K[0] = f(xs[n + 1], y_next, *args)
+    if dense:
+        fs[steps] = K[-1] if tableau.fsal and steps else f(xs[steps], ys[steps], *args)
+    return xs, ys, fs
+
+def explicit_rk(f, x0, y0, h, steps, tableau=RK4, args=(), stats=None):
+    """
+    Explicit Runge-Kutta method driven by a Butcher tableau.
+
+    y may be a scalar or an array (a system, or an ensemble of independent
+    problems); f must return an array of the same shape. The trajectory and
+    the stage values are stored in buffers allocated once up front.
+
+    f may also be a SymPy expression in x and y (scalar ODEs, or ensembles of
+    them), in which case all stages are generated into a single fused step
+    function (see symcompile.rk_step_kernel).
+
+    Parameters:
+    f       : Function representing the ODE y' = f(x, y, *args), or a SymPy
+              expression in the symbols x and y
+    x0      : Initial x value
+    y0      : Initial y value (scalar or array)
+    h       : Step size
+    steps   : Number of steps to take
+    tableau : Tableau to use, or the name of one in TABLEAUX (default RK4)
+    args    : Extra arguments passed to f
+    stats   : SolverStats filled in with the f evaluations, steps and timings
+              (optional)
+
+    Returns:
+    xs      : Array of x values, shape (steps + 1,)
+    ys      : Array of y values, shape (steps + 1,) + shape of y0
+    """
+    xs, ys, _ = _explicit_rk(f, x0, y0, h, steps, tableau, args, False, stats)
+    return xs, ys
+
+def explicit_rk_dense(f, x0, y0, h, steps, tableau=RK4, args=(), stats=None):
+    """
+    Same as explicit_rk, but also records the slope f(x, y) at every step
+    and returns a continuous solution (see dense.HermiteSolution).
+
+    Returns:
+    sol     : HermiteSolution; sol.xs and sol.ys hold the step values and
+              sol(x) evaluates the cubic Hermite interpolant between them
+    """
+    xs, ys, fs = _explicit_rk(f, x0, y0, h, steps, tableau, args, True, stats)
+    return HermiteSolution(xs, ys, fs)
+
+def explicit_rk_chunks(f, x0, y0, h, steps, tableau=RK4, args=(), chunk_size=65536,
+                       stride=1, stats=None):
+    """
+    Streaming version of explicit_rk that never holds the whole trajectory.
+
+    The integration runs in blocks of about chunk_size steps, and every
+    stride-th point (x0 included) is collected into chunks of chunk_size
+    points, which are yielded as they fill up; the last chunk may be shorter.
+    The stride only thins the output: all steps are integrated and the final
+    point is always saved, so there are ceil(steps / stride) + 1 points.
+
+    Parameters:
+    f          : Function representing the ODE y' = f(x, y, *args)
+    x0         : Initial x value
+    y0         : Initial y value (scalar or array)
+    h          : Step size
+    steps      : Number of steps to take
+    tableau    : Tableau to use, or the name of one in TABLEAUX (default RK4)
+    args       : Extra arguments passed to f
+    chunk_size : Number of saved points per chunk
+    stride     : Save every stride-th point
+    stats      : SolverStats filled in as the blocks are integrated (optional)
+
+    Yields:
+    xs, ys     : Arrays of the saved x and y values of one chunk
+    """
+    y = np.asarray(y0, dtype=float)
+    block = stride * max(1, chunk_size // stride)
+    out_x = np.empty(chunk_size)
+    out_y = np.empty((chunk_size,) + y.shape)
+    out_x[0], out_y[0] = x0, y
+    fill = 1
+    n = 0
+    while n < steps:
+        k = min(block, steps - n)
+        _, ys, _ = _explicit_rk(f, x0 + n * h, y, h, k, tableau, args, False, stats)
+        y = ys[-1].copy()
+        saved = ys[stride::stride]
+        index = n + stride * np.arange(1, len(saved) + 1)
+        if k % stride:
+            # Final, partial stride: keep the last point as well
+            saved = np.concatenate([saved, ys[-1:]])
+            index = np.append(index, n + k)
+        n += k
+        while len(saved):
+            take = min(chunk_size - fill, len(saved))
+            out_x[fill:fill + take] = x0 + h * index[:take]
+            out_y[fill:fill + take] = saved[:take]
+            fill += take
+            saved, index = saved[take:], index[take:]
+            if fill == chunk_size:
+                yield out_x.copy(), out_y.copy()
+                fill = 0
+    if fill:
+        yield out_x[:fill].copy(), out_y[:fill].copy()
+
+def explicit_rk_reduce(f, x0, y0, h, steps, reducers, tableau=RK4, args=(), chunk_size=4096,
+                       stats=None):
+    """
+    Integrates with explicit_rk while feeding the points to streaming
+    reducers (see reducers.py) instead of storing the trajectory.
+
+    The integration runs in blocks of chunk_size steps, whose points and
+    slopes are passed to every reducer, so memory use does not grow with
+    steps. It stops early once a terminal reducer (e.g. a FirstCrossing
+    with terminal=True) is done.
+
+    Parameters:
+    f, x0, y0, h, steps, tableau, args : As in explicit_rk
+    reducers   : Sequence of reducers, e.g. [RunningMax(), Integral()]
+    chunk_size : Number of steps per block
+    stats      : SolverStats filled in as the blocks are integrated (optional)
+
+    Returns:
+    x          : x value where the integration ended
+    y          : y value there
+    results    : List with the result of every reducer
+    """
+    from .reducers import feed, results
+    y = np.asarray(y0, dtype=float)
+    n = 0
+    first = True
+    while True:
+        k = min(chunk_size, steps - n)
+        xs, ys, fs = _explicit_rk(f, x0 + n * h, y, h, k, tableau, args, True, stats)
+        # The first point of later blocks is the last point of the previous one
+        start = 0 if first else 1
+        stop = feed(reducers, xs[start:], ys[start:], fs[start:])
+        first = False
+        n += k
+        y = ys[-1].copy()
+        if stop or n >= steps:
+            return xs[-1], y, results(reducers)
@@ -0,0 +1,44 @@
+import argparse
+import importlib
+
+# Subcommand: (module, description); modules are only imported when run
+COMMANDS = {
+    "ap": ("ap", "General solution of y'''' + 3y''' - 2y'' - 4y' + 0.5y = 0"),
+    "euler": ("euler", "Newton's law of cooling with Euler's method"),
+    "find-as": ("find_as", "Vertical asymptote of y' = x^3 y^2 - y/x"),
+    "find-y": ("find_y", "Where the solution of y' = (x + y + 1)^2 crosses y = 0"),
+    "imp-euler": ("imp_euler", "Improved Euler event search for y' = (x + y + 1)^2"),
+    "osc": ("osc", "Forced oscillator coefficients near resonance"),
+    "rk": ("rk", "RK4 approximation of y' = x + 3 - y"),
+    "rkgraph": ("rkgraph", "RK4 solution and maximum of y' = cos(5y) - x"),
+    "rkmax": ("rkmax", "RK4 solution and maximum of y' = 1.8/x^4 - y^2"),
+    "sc": ("sc", "Limit of ((1 + h/2)/(1 - h/2))^(1/h) as h -> 0"),
+    "varofparam": ("varofparam", "Variation of parameters for y''' + 9y'' - 108y = e^(-6x)"),
+}
+
+# Subcommands that plot; they take --output to render to a file instead
+PLOTS = {"find-y", "osc", "rkgraph", "rkmax"}
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="difeq", description="Differential equation solvers.")
+    commands = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for name, (_, description) in COMMANDS.items():
+        command = commands.add_parser(name, help=description, description=description)
+        if name in PLOTS:
+            command.add_argument("-o", "--output", metavar="PATH",
+                                 help="write the plot to PATH (.png, .svg, ...) instead of "
+                                      "showing it")
+    return parser
+
+def main(argv=None):
+    """
+    Entry point of the `difeq` command: runs the main() of the module
+    behind the chosen subcommand.
+    """
+    args = build_parser().parse_args(argv)
+    module = importlib.import_module(f".{COMMANDS[args.command][0]}", __package__)
+    if args.command in PLOTS:
+        module.main(output=args.output)
+    else:
+        module.main()
+    return 0
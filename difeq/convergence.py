@@ -0,0 +1,161 @@
+import numpy as np
+
+class ConvergenceStudy:
+    """
+    Result of convergence_study.
+
+    Attributes:
+    hs           : Step sizes, coarsest first
+    values       : Result at every step size
+    order        : Observed order p from a log-log fit of error against h
+    constant     : C in the fitted error model |error| = C h^p
+    extrapolated : Richardson-extrapolated value from the two finest levels
+    error        : Estimated error of the extrapolated value
+    """
+
+    def __init__(self, hs, values, order, constant, extrapolated, error):
+        self.hs = hs
+        self.values = values
+        self.order = order
+        self.constant = constant
+        self.extrapolated = extrapolated
+        self.error = error
+
+    def step_for(self, tol):
+        """
+        Largest step size whose error the fitted model predicts to be <= tol.
+        """
+        return float(np.min((tol / self.constant) ** (1 / self.order)))
+
+    def __repr__(self):
+        return (f"ConvergenceStudy(order={self.order}, extrapolated={self.extrapolated}, "
+                f"error={self.error})")
+
+def _richardson(v_coarse, v_fine, ratio, p):
+    return v_fine + (v_fine - v_coarse) / (ratio**p - 1)
+
+def convergence_study(solve, hs, exact=None, order=None, vectorized=False):
+    """
+    Observed order of convergence and Richardson extrapolation for a solver
+    run over a ladder of step sizes.
+
+    The order p is the slope of log|error| against log h, where the error is
+    measured against `exact` when it is known and otherwise estimated from
+    the differences between successive levels, which shrink at the same
+    rate. The two finest levels are then combined as
+    v + (v - v_coarse) / (r^p - 1), r the ratio of their step sizes, and the
+    same extrapolation from the next coarser pair gives the error estimate.
+
+    Parameters:
+    solve      : Function solve(h) returning the result (scalar or array) for
+                 step size h; with vectorized=True, solve(hs) returns the
+                 results of all levels at once (see rk_levels)
+    hs         : Ladder of step sizes (any order)
+    exact      : Exact result, if known
+    order      : Order used for the extrapolation (default: the observed one)
+    vectorized : Whether solve takes the whole ladder as one array
+
+    Returns:
+    study      : ConvergenceStudy
+    """
+    hs = np.sort(np.asarray(hs, dtype=float))[::-1]
+    if len(hs) < 2:
+        raise ValueError("a convergence study needs at least two step sizes")
+    if vectorized:
+        values = np.asarray(solve(hs), dtype=float)
+    else:
+        values = np.array([solve(h) for h in hs], dtype=float)
+    shape = values.shape[1:]
+    flat = values.reshape(len(hs), -1)
+
+    if exact is not None:
+        err = np.abs(flat - np.reshape(exact, (1, -1)))
+        h_fit = hs
+    else:
+        if len(hs) < 3:
+            raise ValueError("estimating the order without exact needs at least three step sizes")
+        err = np.abs(np.diff(flat, axis=0))
+        h_fit = hs[:-1]
+    # Least-squares line through the usable (nonzero) errors of each component
+    with np.errstate(divide="ignore"):
+        log_e = np.log(err)
+    log_h = np.log(h_fit)
+    p = np.empty(flat.shape[1])
+    log_c = np.empty(flat.shape[1])
+    for j in range(flat.shape[1]):
+        ok = np.isfinite(log_e[:, j])
+        if np.count_nonzero(ok) < 2:
+            p[j], log_c[j] = np.nan, -np.inf
+            continue
+        p[j], log_c[j] = np.polyfit(log_h[ok], log_e[ok, j], 1)
+    constant = np.exp(log_c)
+    if exact is None:
+        # The differences are (1 - r^-p) times the error of the coarser level
+        ratio = np.mean(hs[:-1] / hs[1:])
+        constant = constant / np.abs(1 - ratio**-p)
+
+    p_used = p if order is None else np.full_like(p, order)
+    r = hs[-2] / hs[-1]
+    extrapolated = _richardson(flat[-2], flat[-1], r, p_used)
+    if len(hs) >= 3:
+        previous = _richardson(flat[-3], flat[-2], hs[-3] / hs[-2], p_used)
+        error = np.abs(extrapolated - previous)
+    else:
+        error = np.abs(flat[-1] - flat[-2]) / np.abs(r**p_used - 1)
+
+    def unflatten(a):
+        return a.reshape(shape) if shape else a[0]
+
+    return ConvergenceStudy(hs, values, unflatten(p), unflatten(constant),
+                            unflatten(extrapolated), unflatten(error))
+
+def rk_levels(f, x0, y0, x_end, hs, tableau="rk4", args=()):
+    """
+    y(x_end) for every step size of a ladder, integrated as one batch.
+
+    All levels advance in lockstep with their own step size, each in its own
+    row of the state, and a level stops (its step becomes 0) once it has
+    taken ceil((x_end - x0) / h) steps. Every step is one vectorized call of
+    f for all levels, so the coarse levels cost almost nothing on top of the
+    finest one. The last step of each level is shortened to land on x_end,
+    so no step is ever longer than h.
+
+    Parameters:
+    f       : Function representing the ODE y' = f(x, y, *args); it must
+              accept x of shape (levels,) and y of shape (levels,) + shape of y0
+    x0      : Initial x value
+    y0      : Initial y value (scalar or array)
+    x_end   : x value to integrate to
+    hs      : Array of step sizes
+    tableau : Tableau to use, or the name of one in butcher.TABLEAUX
+    args    : Extra arguments passed to f
+
+    Returns:
+    ys      : Array of shape (len(hs),) + shape of y0
+    """
+    from .butcher import TABLEAUX
+    tableau = TABLEAUX[tableau] if isinstance(tableau, str) else tableau
+    hs = np.asarray(hs, dtype=float)
+    y0 = np.asarray(y0, dtype=float)
+    # The tolerance keeps e.g. 1 / 0.1 = 10.000000000000002 at 10 steps
+    q = (x_end - x0) / hs
+    n_steps = np.maximum(1, np.ceil(q - 1e-9 * np.maximum(1.0, q)).astype(int))
+    h_last = (x_end - x0) - (n_steps - 1) * hs
+    tail = (1,) * y0.ndim
+    y = np.broadcast_to(y0, hs.shape + y0.shape).copy()
+    x = np.full(hs.shape, float(x0))
+    K = np.empty((len(tableau.c),) + y.shape)
+    for n in range(int(n_steps.max())):
+        h = np.where(n < n_steps - 1, hs, np.where(n == n_steps - 1, h_last, 0.0))
+        hb = h.reshape(h.shape + tail)
+        for i, c_i in enumerate(tableau.c):
+            y_stage = y.copy()
+            for j, a_ij in enumerate(tableau.a[i][:i]):
+                if a_ij:
+                    y_stage += (hb * a_ij) * K[j]
+            K[i] = f(x + c_i * h, y_stage, *args)
+        for i, b_i in enumerate(tableau.b):
+            if b_i:
+                y += (hb * b_i) * K[i]
+        x = x + h
+    return y
@@ -0,0 +1,149 @@
+import numpy as np
+
+class HermiteSolution:
+    """
+    Continuous extension of a step-by-step ODE solution.
+
+    Between two steps the solution is the cubic Hermite polynomial matching
+    y and y' = f(x, y) at both ends, which is fourth-order accurate and so
+    matches RK4. Extrema and level crossings are located on this interpolant
+    inside the steps instead of on the step grid.
+
+    Attributes:
+    xs : Array of x values (increasing or decreasing)
+    ys : Array of y values, shape (len(xs),) or (len(xs), ...)
+    fs : Array of slopes f(x, y) at the same points
+    """
+
+    def __init__(self, xs, ys, fs):
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.fs = np.asarray(fs, dtype=float)
+
+    def _component(self, values, component):
+        if component is not None:
+            return values[(slice(None),) + tuple(np.atleast_1d(component))]
+        if values.ndim > 1:
+            raise ValueError("pass component= to query a vector-valued solution")
+        return values
+
+    def _coefficients(self, component=None):
+        # Coefficients c0..c3 of p(t) = c0 + c1 t + c2 t^2 + c3 t^3, t in [0, 1]
+        ys = self._component(self.ys, component)
+        fs = self._component(self.fs, component)
+        h = np.diff(self.xs)
+        y0, y1 = ys[:-1], ys[1:]
+        hf0, hf1 = h * fs[:-1], h * fs[1:]
+        delta = y1 - y0
+        return y0, hf0, 3 * delta - 2 * hf0 - hf1, -2 * delta + hf0 + hf1
+
+    def __call__(self, x):
+        """
+        Evaluates the interpolant at x (scalar or array).
+        """
+        x = np.asarray(x, dtype=float)
+        xs = self.xs
+        sign = 1.0 if xs[-1] >= xs[0] else -1.0
+        i = np.clip(np.searchsorted(sign * xs, sign * x, side="right") - 1,
+                    0, len(xs) - 2)
+        h = xs[i + 1] - xs[i]
+        t = (x - xs[i]) / h
+        # Broadcast against the trailing dimensions of vector-valued solutions
+        shape = t.shape + (1,) * (self.ys.ndim - 1)
+        t, h = t.reshape(shape), h.reshape(shape)
+        y0, y1 = self.ys[i], self.ys[i + 1]
+        f0, f1 = self.fs[i], self.fs[i + 1]
+        return ((1 + 2*t) * (1 - t)**2 * y0 + t * (1 - t)**2 * h * f0
+                + t**2 * (3 - 2*t) * y1 + t**2 * (t - 1) * h * f1)
+
+    def _pieces(self, component):
+        # Split every step at the critical points of its cubic so that the
+        # interpolant is monotone on each piece
+        c0, c1, c2, c3 = self._coefficients(component)
+        a, b, c = 3 * c3, 2 * c2, c1
+        disc = b**2 - 4 * a * c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sq = np.sqrt(np.where(disc >= 0, disc, np.nan))
+            quad = np.stack([(-b - sq) / (2 * a), (-b + sq) / (2 * a)], axis=1)
+            lin = np.where(b != 0, -c / b, np.nan)
+        crit = np.where(np.abs(a)[:, None] > 1e-14 * (np.abs(b) + np.abs(c))[:, None],
+                        quad, np.stack([lin, np.full_like(lin, np.nan)], axis=1))
+        crit = np.where((crit > 0) & (crit < 1), crit, np.nan)
+        crit.sort(axis=1)
+        n = len(c0)
+        t = np.column_stack([np.zeros(n), crit, np.ones(n)])
+        # Pieces with nan ends collapse onto the previous point
+        t = np.fmax.accumulate(np.where(np.isnan(t), -np.inf, t), axis=1)
+        return (c0, c1, c2, c3), t
+
+    @staticmethod
+    def _poly(coef, t, rows):
+        c0, c1, c2, c3 = (c[rows] for c in coef)
+        return c0 + t * (c1 + t * (c2 + t * c3))
+
+    def _extremum(self, sign, a, b, component):
+        coef, t = self._pieces(component)
+        rows = np.repeat(np.arange(len(t))[:, None], t.shape[1], axis=1)
+        x = self.xs[rows] + t * np.diff(self.xs)[rows]
+        y = self._poly(coef, t, rows)
+        lo, hi = min(a, b), max(a, b)
+        keep = (x >= lo) & (x <= hi)
+        cand_x = np.concatenate([x[keep], [a, b]])
+        cand_y = np.concatenate([y[keep], self._at(np.array([a, b]), component)])
+        i = np.argmax(sign * cand_y)
+        return cand_y[i], cand_x[i]
+
+    def _at(self, x, component):
+        return self._component(self(x), component)
+
+    def _bounds(self, a, b):
+        a = self.xs[0] if a is None else a
+        b = self.xs[-1] if b is None else b
+        return a, b
+
+    def maximum(self, a=None, b=None, component=None):
+        """
+        Maximum of the interpolant over [a, b] (default: the whole solution).
+
+        Returns:
+        max_y : The maximum y value
+        max_x : The x value at which it occurs
+        """
+        return self._extremum(1, *self._bounds(a, b), component)
+
+    def minimum(self, a=None, b=None, component=None):
+        """
+        Minimum of the interpolant over [a, b] (default: the whole solution).
+
+        Returns:
+        min_y : The minimum y value
+        min_x : The x value at which it occurs
+        """
+        return self._extremum(-1, *self._bounds(a, b), component)
+
+    def roots(self, level=0.0, component=None, xtol=1e-13):
+        """
+        All x where the interpolant crosses y = level, in order of x.
+
+        Every monotone piece of every step whose ends bracket the level is
+        refined by vectorized bisection on the interpolant.
+        """
+        coef, t = self._pieces(component)
+        rows = np.repeat(np.arange(len(t))[:, None], t.shape[1] - 1, axis=1)
+        t_lo, t_hi = t[:, :-1], t[:, 1:]
+        g_lo = self._poly(coef, t_lo, rows) - level
+        g_hi = self._poly(coef, t_hi, rows) - level
+        # Half-open brackets so a root on a shared end is only counted once
+        hit = (t_hi > t_lo) & (((g_lo < 0) & (g_hi >= 0)) | ((g_lo > 0) & (g_hi <= 0)))
+        rows, lo, hi = rows[hit], t_lo[hit], t_hi[hit]
+        rising = g_lo[hit] < 0
+        h = np.diff(self.xs)[rows]
+        for _ in range(64):
+            if not lo.size or np.max((hi - lo) * np.abs(h)) <= xtol:
+                break
+            mid = (lo + hi) / 2
+            below = self._poly(coef, mid, rows) - level < 0
+            move_lo = below == rising
+            lo = np.where(move_lo, mid, lo)
+            hi = np.where(move_lo, hi, mid)
+        return self.xs[rows] + hi * h
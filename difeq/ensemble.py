@@ -0,0 +1,38 @@
+import numpy as np
+
+from .butcher import explicit_rk
+
+def ensemble(f, x0, y0, h, steps, method="rk4", args=(), stats=None):
+    """
+    Integrates a whole ensemble of IVPs y' = f(x, y, *args) together.
+
+    Every ensemble member shares x0, h and the number of steps. The initial
+    values y0 and each entry of args are broadcast against each other, so one
+    call to f per stage advances all members at once; f must therefore accept
+    NumPy arrays for y and the parameters.
+
+    Parameters:
+    f      : Function representing the ODE y' = f(x, y, *args)
+    x0     : Initial x value
+    y0     : Initial y values (scalar or array)
+    h      : Step size
+    steps  : Number of steps to take
+    method : Name of a tableau in butcher.TABLEAUX ("euler", "heun" as in
+             imp_euler, "rk4", "rk38", "dopri54") or a Tableau
+    args   : Extra parameters passed to f, each a scalar or an array that
+             broadcasts against y0 (e.g. M and K of euler.dTdt)
+    stats  : SolverStats filled in with the work done (optional); a call of f
+             for the whole ensemble counts as one evaluation
+
+    Returns:
+    xs     : Array of x values, shape (steps + 1,)
+    ys     : Array of y values, shape (members, steps + 1), one row per
+             member of the flattened broadcast of y0 and args
+    """
+    args = tuple(np.asarray(a, dtype=float) for a in args)
+    shape = np.broadcast_shapes(np.shape(y0), *(a.shape for a in args))
+    y = np.broadcast_to(np.asarray(y0, dtype=float), shape).ravel()
+    args = tuple(np.broadcast_to(a, shape).ravel() for a in args)
+
+    xs, ys = explicit_rk(f, x0, y, h, steps, method, args, stats)
+    return xs, ys.T
@@ -0,0 +1,226 @@
+import numpy as np
+
+from .stats import counted, phase
+
+def improved_euler(f, x0, y0, h):
+    """
+    Performs one step of the Improved Euler (Heun's) method.
+
+    Parameters:
+    - f: Function defining dy/dx = f(x, y)
+    - x0: Current x value
+    - y0: Current y value
+    - h: Step size
+
+    Returns:
+    - y_next: Approximated y value after step h
+    """
+    F = f(x0, y0)
+    G = f(x0 + h, y0 + h * F)
+    y_next = y0 + (h / 2) * (F + G)
+    return y_next
+
+def find_vertical_asymptote(f, x0, y0, a, b, h=0.01, threshold=1e6, precision=0.01):
+    """
+    Uses Improved Euler's method to find the x value where y becomes very large,
+    indicating a vertical asymptote.
+
+    Parameters:
+    - f: Function defining dy/dx = f(x, y)
+    - x0: Initial x value
+    - y0: Initial y value
+    - a: Start of the interval
+    - b: End of the interval
+    - h: Step size
+    - threshold: y value to consider as 'infinite' for asymptote detection
+    - precision: Desired precision for x (e.g., 0.01 for two decimal places)
+
+    Returns:
+    - asymptote_x: x value where vertical asymptote occurs (rounded to two decimals)
+    - steps: Number of steps taken to reach the asymptote
+    """
+    x = a
+    y = y0
+    steps = 0
+    asymptote_x = None
+
+    while x < b:
+        y_next = improved_euler(f, x, y, h)
+        x_next = x + h
+        steps += 1
+
+        if y_next > threshold:
+            # Asymptote is between x and x_next
+            # Refine within this interval
+            lower = x
+            upper = x_next
+            refined_h = precision / 100  # Start with finer steps
+            refined_x = lower
+            refined_y = y
+
+            while refined_x < upper:
+                refined_y_next = improved_euler(f, refined_x, refined_y, refined_h)
+                refined_x_new = refined_x + refined_h
+
+                if refined_y_next > threshold:
+                    asymptote_x = round(refined_x_new, 2)
+                    return asymptote_x, steps
+                refined_x = refined_x_new
+                refined_y = refined_y_next
+
+            # If not found in refined steps
+            asymptote_x = round(upper, 2)
+            return asymptote_x, steps
+
+        y = y_next
+        x = x_next
+
+    return asymptote_x, steps
+
+def find_vertical_asymptotes(f, x0, y0, b, h=0.01, tol=1e-6, switch=2.0,
+                             precision=1e-8, max_steps=100000, stats=None):
+    """
+    Locates the blow-up point of y for a whole batch of initial conditions.
+
+    Each member is integrated with Improved Euler steps under adaptive step
+    size control: the difference between the Euler and Heun updates estimates
+    the local error, which is kept below tol * (1 + |y|). Once |y| exceeds
+    `switch` the member continues with w = 1/y (and back again once |w|
+    exceeds `switch`), which satisfies
+    dw/dx = -w^2 f(x, 1/w) and passes smoothly through zero where y blows up.
+    The step in which w changes sign is bisected until the location is known
+    to `precision`. f must accept NumPy arrays.
+
+    Parameters:
+    - f: Function defining dy/dx = f(x, y)
+    - x0: Initial x values (scalar or array)
+    - y0: Initial y values (scalar or array, broadcast against x0)
+    - b: End of the interval to search
+    - h: Initial and largest step size
+    - tol: Local error tolerance of the step size control
+    - switch: |y| above which the member is integrated as w = 1/y (must be > 1)
+    - precision: Width of the final bracket around the asymptote
+    - max_steps: Maximum number of accepted steps per member; at most
+      10 * max_steps steps are attempted, rejected ones included
+    - stats: SolverStats filled in with the work done (optional); every batched
+      call of f counts as one evaluation, and the bisection is timed under "bisect"
+
+    Returns:
+    - asymptote_x: Array of asymptote locations, nan where none was found
+    - steps: Array with the number of accepted steps of each member
+    - exhausted: Boolean array, True where a member ran out of steps before
+      reaching b, or stalled because its step size underflowed (e.g. where f
+      is not finite), so its nan only means the search was cut short;
+      elsewhere nan means y stays finite on [x0, b]
+    """
+    x0, y0 = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(y0, dtype=float))
+    f = counted(stats, f)
+    shape = x0.shape
+    x = x0.ravel().copy()
+    u = y0.ravel().copy()          # y, or w = 1/y for inverted members
+    inverted = np.zeros(x.size, dtype=bool)
+    done = np.zeros(x.size, dtype=bool)
+    h_next = np.full(x.size, float(h))
+    steps = np.zeros(x.size, dtype=int)
+    attempts = np.zeros(x.size, dtype=int)
+    stalled = np.zeros(x.size, dtype=bool)
+    asymptote_x = np.full(x.size, np.nan)
+
+    def rhs(xi, ui, inv):
+        out = np.empty_like(ui)
+        if np.any(~inv):
+            out[~inv] = f(xi[~inv], ui[~inv])
+        if np.any(inv):
+            w = ui[inv]
+            out[inv] = -w**2 * f(xi[inv], 1 / w)
+        return out
+
+    def step(xi, ui, inv, hi):
+        F = rhs(xi, ui, inv)
+        G = rhs(xi + hi, ui + hi * F, inv)
+        return ui + (hi / 2) * (F + G), hi * (G - F) / 2
+
+    with np.errstate(all="ignore"), phase(stats, "total"):
+        while True:
+            active = ~done & ~stalled & (x < b) & (steps < max_steps) & (attempts < 10 * max_steps)
+            if not np.any(active):
+                break
+            idx = np.flatnonzero(active)
+            xi, ui, inv = x[idx], u[idx], inverted[idx]
+            hi = np.minimum(h_next[idx], b - xi)
+            u_new, error = step(xi, ui, inv, hi)
+
+            error = np.abs(error) / (tol * (1 + np.maximum(np.abs(ui), np.abs(u_new))))
+            accept = np.isfinite(u_new) & (error <= 1)
+            factor = np.clip(0.9 / np.sqrt(error), 0.2, 5.0)
+            factor = np.where(np.isfinite(factor), factor, 0.2)
+            h_next[idx] = np.minimum(hi * factor, h)
+            attempts[idx] += 1
+            # A step too small to move x never gets accepted
+            stalled[idx] = ~accept & (xi + h_next[idx] <= xi)
+
+            idx, xi, ui, inv, hi, u_new = (a[accept] for a in (idx, xi, ui, inv, hi, u_new))
+            steps[idx] += 1
+            if stats is not None:
+                stats.naccept += len(idx)
+                stats.nreject += np.count_nonzero(~accept)
+
+            # w reaching zero brackets the asymptote in [xi, xi + hi]
+            cross = inv & (np.sign(u_new) != np.sign(ui))
+            if np.any(cross):
+                with phase(stats, "bisect"):
+                    lo = np.zeros(np.count_nonzero(cross))
+                    up = hi[cross]
+                    xc, wc = xi[cross], ui[cross]
+                    while np.max(up - lo) > precision:
+                        mid = (lo + up) / 2
+                        w_mid, _ = step(xc, wc, np.ones(len(xc), dtype=bool), mid)
+                        same = np.sign(w_mid) == np.sign(wc)
+                        lo = np.where(same, mid, lo)
+                        up = np.where(same, up, mid)
+                    asymptote_x[idx[cross]] = xc + (lo + up) / 2
+                    done[idx[cross]] = True
+
+            keep = ~cross
+            idx, xi, u_new, inv, hi = (a[keep] for a in (idx, xi, u_new, inv, hi))
+            x[idx] = xi + hi
+            # Switch representation; switch > 1 leaves some hysteresis
+            to_w = ~inv & (np.abs(u_new) > switch)
+            to_y = inv & (np.abs(u_new) > switch)
+            u[idx] = np.where(to_w | to_y, 1 / u_new, u_new)
+            inverted[idx] = inv ^ to_w ^ to_y
+
+    exhausted = ~done & (x < b)
+    return asymptote_x.reshape(shape), steps.reshape(shape), exhausted.reshape(shape)
+
+# Define the differential equation dy/dx = x^3 y^2 - y/x
+def f(x, y):
+    return x**3 * y**2 - y / x
+
+def main():
+    # Initial conditions
+    x0 = 0.9
+    y0 = 3.2
+
+    # End of the range to search for asymptote
+    b = 1.5
+
+    # Step size
+    h = 0.01
+
+    # Desired precision for x
+    precision = 0.01  # Two decimal places
+
+    # Find the vertical asymptote
+    asymptote_x, steps, exhausted = find_vertical_asymptotes(f, x0, y0, b, h, precision=precision / 100)
+
+    if np.isfinite(asymptote_x):
+        print(f"Vertical asymptote detected at x = {round(float(asymptote_x), 2)}")
+        print(f"Number of steps taken: {steps}")
+    elif exhausted:
+        print(f"Search stopped after {steps} steps before reaching x = {b}.")
+    else:
+        print(f"No vertical asymptote detected within the interval [{x0}, {b}].")
+
+if __name__ == "__main__":
+    main()
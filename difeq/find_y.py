@@ -0,0 +1,159 @@
+import numpy as np
+
+class LevelCrossings:
+    """
+    Index of the monotone segments of a dense ODE solution, for answering
+    many "where does y reach this value" queries against one solve.
+
+    The solution is split at every point where y' = f(x, y) changes sign
+    (located with brentq), so y is monotone on each segment. Segments are
+    kept sorted by their minimum value; a query only visits the segments
+    whose [min, max] range contains the target, and the crossing inside each
+    is refined by bisection on the continuous extension, vectorized over all
+    queries at once.
+
+    Parameters:
+    sol        : Dense solution, e.g. solve_ivp(..., dense_output=True).sol
+    f          : Right-hand side f(x, y) that was integrated
+    component  : Index of the y component to query
+    samples    : Points per step at which the sign of f is checked
+    vectorized : Whether f accepts y of shape (n, k) as in solve_ivp
+    """
+
+    def __init__(self, sol, f, component=0, samples=4, vectorized=False):
+        from scipy.optimize import brentq
+
+        self.sol = sol
+        self.component = component
+        ts = np.asarray(sol.ts, dtype=float)
+        if ts[-1] < ts[0]:
+            raise ValueError("the solution must be integrated forward in x")
+
+        def slope(x):
+            return np.asarray(f(x, sol(x)))[component]
+
+        # Sign of the slope on a sub-grid of every step
+        frac = np.linspace(0, 1, samples + 1)[:-1]
+        grid = np.append((ts[:-1, None] + frac * np.diff(ts)[:, None]).ravel(), ts[-1])
+        if vectorized:
+            g = np.asarray(f(grid, sol(grid)))[component]
+        else:
+            g = np.array([slope(x) for x in grid])
+        breaks = [grid[0]]
+        for i in np.nonzero(np.sign(g[:-1]) * np.sign(g[1:]) < 0)[0]:
+            breaks.append(brentq(slope, grid[i], grid[i + 1], xtol=1e-14))
+        breaks.extend(grid[1:-1][g[1:-1] == 0])
+        breaks.append(grid[-1])
+        self.breaks = np.unique(breaks)
+
+        values = self._y(self.breaks)
+        self.values = values
+        lo = np.minimum(values[:-1], values[1:])
+        hi = np.maximum(values[:-1], values[1:])
+        self.order = np.argsort(lo, kind="stable")
+        self.lo, self.hi = lo[self.order], hi[self.order]
+
+    def _y(self, x):
+        return np.asarray(self.sol(x))[self.component]
+
+    def query(self, targets, xtol=1e-12):
+        """
+        All crossings of every target value.
+
+        Returns:
+        index : Array with the position in targets of each crossing
+        x     : Array of crossing x values, sorted by (index, x)
+        """
+        targets = np.atleast_1d(np.asarray(targets, dtype=float))
+        # Candidate segments have lo <= target, a prefix of the sorted order
+        count = np.searchsorted(self.lo, targets, side="right")
+        q, k = np.nonzero(np.arange(len(self.lo))[None, :] < count[:, None])
+        seg = self.order[k]
+        t = targets[q]
+        a, b = self.breaks[seg], self.breaks[seg + 1]
+        va, vb = self.values[seg], self.values[seg + 1]
+        # Half-open segments (a, b] so a crossing on a break is counted once
+        hit = (self.hi[k] >= t) & ((va != t) | (seg == 0))
+        q, t, a, b, va, vb = q[hit], t[hit], a[hit], b[hit], va[hit], vb[hit]
+        rising = vb > va
+        x = np.where(va == t, a, b)
+        pending = (va != t) & (vb != t)
+        for _ in range(100):
+            if not pending.any() or np.max(b - a, initial=0) <= xtol:
+                break
+            mid = (a + b) / 2
+            below = self._y(mid) < t
+            move_a = below == rising
+            a = np.where(move_a, mid, a)
+            b = np.where(move_a, b, mid)
+        x = np.where(pending, (a + b) / 2, x)
+        order = np.lexsort((x, q))
+        return q[order], x[order]
+
+    def roots(self, target, xtol=1e-12):
+        """
+        All x where the solution crosses y = target, in order of x.
+        """
+        return self.query([target], xtol)[1]
+
+    def first(self, targets, xtol=1e-12):
+        """
+        First x at which the solution reaches each target (nan if never).
+        """
+        targets = np.atleast_1d(np.asarray(targets, dtype=float))
+        index, x = self.query(targets, xtol)
+        first = np.full(len(targets), np.nan)
+        # Crossings are sorted by x within each target, so keep the first one
+        keep = np.r_[True, index[1:] != index[:-1]] if len(index) else index.astype(bool)
+        first[index[keep]] = x[keep]
+        return first
+
+# Define the ODE
+def dy_dx(x, y):
+    return (x + y + 1)**2
+
+def main(output=None):
+    from scipy.integrate import solve_ivp
+
+    # Initial conditions
+    x0 = 0
+    y0 = -1
+
+    # Define the target range
+    a = 0
+    b = 1.4
+    target_y = 0
+    # Solve the ODE
+    sol = solve_ivp(dy_dx, [a, b], [y0], method='RK45', dense_output=True, rtol=1e-10, atol=1e-12)
+
+    # Extract the solution
+    x_vals = np.linspace(a, b, 1000)
+    y_vals = sol.sol(x_vals)[0]
+
+    # Plot the solution, to a file (headless) when an output path is given
+    if output is not None:
+        from .render import render
+        render(output, [(x_vals, y_vals, 'Numerical Solution (RK45)')], hlines=[(0, 'y = 0')],
+               title='Solution of dy/dx = (x + y + 1)^2 with y(0) = -1', ylabel='y(x)')
+    else:
+        _show(x_vals, y_vals)
+
+    # Find the x where y crosses 0 on the continuous extension
+    crossings = LevelCrossings(sol.sol, dy_dx, vectorized=True)
+    x_target = crossings.first(target_y)[0]
+    print(f"The value of x where y(x) ≈ {target_y} is approximately x = {x_target:.4f}")
+
+def _show(x_vals, y_vals):
+    import matplotlib.pyplot as plt
+
+    plt.plot(x_vals, y_vals, label='Numerical Solution (RK45)')
+    plt.axhline(y=0, color='r', linestyle='--', label='y = 0')
+    plt.xlabel('x')
+    plt.ylabel('y(x)')
+    plt.title('Solution of dy/dx = (x + y + 1)^2 with y(0) = -1')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+if __name__ == "__main__":
+    main()
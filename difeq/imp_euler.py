@@ -0,0 +1,401 @@
+import math
+
+from .stats import counted, phase
+
+def imp_euler(f,x,y,c,N,h=None,v = 0,cache=None,stats=None):
+    # stats: optional SolverStats filled in with the f evaluations, steps and time
+    if cache is not None:
+        # Resume from the nearest checkpoint of this trajectory (see trajcache).
+        # The trajectory is keyed by h, so it must be fixed: with h = (c - x)/N
+        # every endpoint would be a different trajectory. As below, the result
+        # is y after N steps of h, at x + N*h.
+        if not h:
+            raise ValueError("imp_euler with cache= needs an explicit step size h")
+        from .trajcache import function_key
+        advance = lambda x, y, h, n: imp_euler(f, x, y, x + n * h, n, h, stats=stats)
+        return cache.state((function_key(f), "imp_euler"), x, y, h, x + N * h, advance)
+    h = h if h else (c - x) / N
+    f = counted(stats, f)
+    if v ==1: print(f"intial values, x = {x}, y = {y}")
+    with phase(stats, "total"):
+        for i in range(N):
+            F = f(x,y)
+            G = f(x + h, (y + h * F))
+
+            x = x + h
+            y = y + h * (F + G)/2
+            if v == 1: print(f"step {i + 1}, x = {x}, y = {y}")
+    if stats is not None:
+        stats.naccept += N
+    return y
+
+def imp_euler_adaptive(f, x, y, c, atol=1e-6, rtol=1e-6, h=None, max_steps=100000,
+                       safety=0.9, min_factor=0.2, max_factor=5.0, v=0, stats=None):
+    """
+    Improved Euler method with adaptive step size control.
+
+    The Euler step y + h*F and the Heun step y + h*(F + G)/2 share the same two
+    f evaluations, so their difference h*(G - F)/2 is a free estimate of the
+    local error of the Euler step. Each step is accepted when that estimate is
+    within atol + rtol*|y|, and the next step size is scaled by
+    safety*(1/err)^(1/2), clipped to [min_factor, max_factor].
+
+    Parameters:
+    f (function): The function defining the differential equation dy/dx = f(x, y).
+    x (float): The initial value of x.
+    y (float): The initial value of y.
+    c (float): The value of x to integrate to.
+    atol (float, optional): Absolute local error tolerance. Default is 1e-6.
+    rtol (float, optional): Relative local error tolerance. Default is 1e-6.
+    h (float, optional): Initial step size. Default is (c - x) / 100.
+    max_steps (int, optional): Maximum number of attempted steps. Default is 100000.
+    safety (float, optional): Safety factor on the predicted step size. Default is 0.9.
+    min_factor (float, optional): Smallest allowed step size ratio. Default is 0.2.
+    max_factor (float, optional): Largest allowed step size ratio. Default is 5.0.
+    v (int, optional): Print every accepted step when set to 1.
+    stats (SolverStats, optional): Filled in with the f evaluations, accepted and
+        rejected steps and timings of the run.
+    Returns:
+    float: The estimated value of y at x = c.
+    """
+    with phase(stats, "total"):
+        return _imp_euler_adaptive(counted(stats, f), x, y, c, atol, rtol, h, max_steps,
+                                   safety, min_factor, max_factor, v, stats)
+
+def _imp_euler_adaptive(f, x, y, c, atol, rtol, h, max_steps, safety, min_factor, max_factor,
+                        v, stats):
+    h = h if h else (c - x) / 100
+    direction = 1 if c >= x else -1
+    h = direction * abs(h)
+    if v == 1: print(f"intial values, x = {x}, y = {y}")
+
+    F = f(x, y)
+    accepted = 0
+    for _ in range(max_steps):
+        if direction * (c - x) <= 0:
+            return y
+        last = direction * (x + h - c) >= 0
+        if last:
+            h = c - x
+        G = f(x + h, (y + h * F))
+        y_new = y + h * (F + G)/2
+
+        scale = atol + rtol * max(abs(y), abs(y_new))
+        error = abs(h * (G - F) / 2) / scale
+        if error <= 1:
+            x = c if last else x + h
+            y = y_new
+            F = f(x, y)
+            accepted += 1
+            if v == 1: print(f"step {accepted}, x = {x}, y = {y}, h = {h}")
+            if stats is not None:
+                stats.naccept += 1
+        elif stats is not None:
+            stats.nreject += 1
+        factor = max_factor if error == 0 else safety * error ** -0.5
+        h = h * min(max_factor, max(min_factor, factor))
+    if direction * (c - x) <= 0:
+        return y
+    raise RuntimeError(f"imp_euler_adaptive did not reach x = {c} in {max_steps} steps (x = {x})")
+
+def imp_euler_with_tolerance(f, x0, y0, c, tol=1e-6, max_steps=100000, stats=None):
+    """
+    Solve an ODE with the Improved Euler method to a given tolerance, using
+    adaptive step size control (see imp_euler_adaptive).
+    Parameters:
+    f (function): The function defining the differential equation dy/dx = f(x, y).
+    x0 (float): The initial value of x.
+    y0 (float): The initial value of y.
+    c (float): The value of x to integrate to.
+    tol (float, optional): The tolerance for the local error estimate, used as both
+        the absolute and the relative tolerance. Default is 1e-6.
+    max_steps (int, optional): The maximum number of attempted steps. Default is 100000.
+    stats (SolverStats, optional): Filled in with the work done (see imp_euler_adaptive).
+    Returns:
+    float: The estimated value of y at x = c.
+    Prints:
+    The initial values and the final y value.
+    """
+    print(f"Initial values, x = {x0}, y = {y0}")
+    y_new = imp_euler_adaptive(f, x0, y0, c, atol=tol, rtol=tol, max_steps=max_steps, stats=stats)
+    print(f"Tolerance reached, y = {y_new}")
+    return y_new
+import numpy as np
+
+def imp_euler_trajectory(f, x, y, c, N, h=None, stats=None):
+    """
+    Runs the Improved Euler method once from x to c and keeps every step.
+
+    Parameters:
+    - f: The function f(x, y) defining the differential equation dy/dx = f(x, y).
+    - x: Initial x-value.
+    - y: Initial y-value.
+    - c: x-value to integrate to.
+    - N: Number of steps.
+    - h: Step size (default is (c - x) / N).
+    - stats: SolverStats filled in with the f evaluations, steps and timings (optional).
+
+    Returns:
+    - A tuple (xs, ys) of NumPy arrays of length N + 1 holding the trajectory.
+    """
+    h = h if h else (c - x) / N
+    f = counted(stats, f)
+    xs = x + h * np.arange(N + 1)
+    ys = np.empty(N + 1)
+    ys[0] = y
+    with phase(stats, "total"):
+        for i in range(N):
+            F = f(xs[i], y)
+            G = f(xs[i] + h, (y + h * F))
+            y = y + h * (F + G)/2
+            ys[i + 1] = y
+    if stats is not None:
+        stats.naccept += N
+    return xs, ys
+
+def imp_euler_reduce(f, x, y, c, N, reducers, h=None, block=1024, stats=None):
+    """
+    Runs the Improved Euler method from x to c, feeding every step to
+    streaming reducers (see reducers.py) instead of storing the trajectory.
+
+    Steps are collected in a buffer of `block` points together with the
+    slopes F = f(x, y) the method computes anyway, and handed to the reducers
+    whenever it fills up, so memory use is independent of N. The integration
+    stops early once a terminal reducer is done.
+
+    Parameters:
+    - f: The function f(x, y) defining the differential equation dy/dx = f(x, y).
+    - x: Initial x-value.
+    - y: Initial y-value.
+    - c: x-value to integrate to.
+    - N: Number of steps.
+    - reducers: Sequence of reducers, e.g. [RunningMax(), FirstCrossing(0)].
+    - h: Step size (default is (c - x) / N).
+    - block: Number of points per block handed to the reducers.
+    - stats: SolverStats filled in with the f evaluations, steps and timings (optional).
+
+    Returns:
+    - A tuple (x, y, results): the final point and the list of reducer results.
+    """
+    from .reducers import feed, results
+    h = h if h else (c - x) / N
+    f = counted(stats, f)
+    x0 = x
+    xs, ys, fs = np.empty(block), np.empty(block), np.empty(block)
+    fill = 0
+    with phase(stats, "total"):
+        F = f(x, y)
+        for i in range(N + 1):
+            xs[fill], ys[fill], fs[fill] = x, y, F
+            fill += 1
+            if fill == block or i == N:
+                if feed(reducers, xs[:fill], ys[:fill], fs[:fill]) or i == N:
+                    break
+                fill = 0
+            G = f(x + h, (y + h * F))
+            y = y + h * (F + G)/2
+            x = x0 + (i + 1) * h
+            F = f(x, y)
+            if stats is not None:
+                stats.naccept += 1
+    return x, y, results(reducers)
+
+def max_value_in_range(f, x0, y0, a, b, step=0.001, N_steps=1000, mode="sweep"):
+    """
+    Finds the maximum y value obtained by Euler's method over the range [a, b].
+
+    Parameters:
+    - f: The function f(x, y) defining the differential equation dy/dx = f(x, y).
+    - x0: Initial x-value.
+    - y0: Initial y-value.
+    - a: Start of the range for x.
+    - b: End of the range for x.
+    - step: Step size for generating x-values (default is 0.001).
+    - N_steps: Number of steps to use in Euler's method (default is 1000).
+      Only used when mode is "grid".
+    - mode: "sweep" (default) integrates once from x0 to b with step size
+      `step` and takes the maximum of the trajectory over [a, b]; when a < x0
+      it also integrates backward from x0 to a. The maximum is tracked while
+      stepping, without storing the trajectory.
+      "grid" re-integrates from x0 with N_steps steps for every x in
+      np.arange(a, b + step, step), as earlier versions did.
+
+    Returns:
+    - A tuple (max_x, max_y) where max_y is the maximum y value found in the range,
+      and max_x is the corresponding x value.
+    """
+    if mode == "sweep":
+        # One integration: the trajectory passes through every x in [a, b]
+        from .reducers import RunningMax
+        # Forward from x0 to b and, if the range starts before x0, backward to a
+        ends = ([b] if b > x0 else []) + ([a] if a < x0 else [])
+        max_x, max_y = (x0, y0) if a <= x0 <= b else (None, -np.inf)
+        for end in ends:
+            N = max(int(np.ceil(abs(end - x0) / step - 1e-9)), 1)
+            _, _, [(y_end, x_end)] = imp_euler_reduce(f, x0, y0, end, N,
+                                                      [RunningMax(start=a, stop=b, dense=False)])
+            if y_end > max_y:
+                max_x, max_y = x_end, y_end
+        return max_x, max_y
+    if mode != "grid":
+        raise ValueError(f"unknown mode {mode!r}, expected 'sweep' or 'grid'")
+
+    # Initialize maximum values
+    max_x = None
+    max_y = -np.inf  # Use negative infinity to handle negative y values
+
+    # Generate x-values using NumPy's arange for efficiency
+    # Adding step to b to include the endpoint if possible
+    range_list = np.arange(a, b + step, step)
+
+    for x in range_list:
+        # Estimate y at current x using Improved Euler's method
+        est = imp_euler(f, x0, y0, x, N_steps)
+        
+        # Update maximum y and corresponding x if a new maximum is found
+        if est > max_y:
+            max_y = est
+            max_x = x
+
+    return max_x, max_y
+
+def level_event(target, terminal=False, direction=0):
+    """
+    Builds the event function g(x, y) = y - target for imp_euler_events.
+
+    Parameters:
+    - target: The y value to watch for.
+    - terminal: Stop the integration at the first crossing (default is False).
+    - direction: 1 to only report upward crossings, -1 for downward ones,
+      0 for both (default is 0).
+
+    Returns:
+    - The event function, with `terminal` and `direction` attributes set.
+    """
+    def event(x, y):
+        return y - target
+    event.terminal = terminal
+    event.direction = direction
+    return event
+
+def _hermite(x0, y0, F0, x1, y1, F1, x):
+    # Cubic Hermite interpolant of one step from its end values and slopes
+    h = x1 - x0
+    t = (x - x0) / h
+    return ((1 + 2*t) * (1 - t)**2 * y0 + t * (1 - t)**2 * h * F0
+            + t**2 * (3 - 2*t) * y1 + t**2 * (t - 1) * h * F1)
+
+def _fires(g0, g1, direction):
+    if direction >= 0 and g0 < 0 <= g1:
+        return True
+    if direction <= 0 and g0 > 0 >= g1:
+        return True
+    return False
+
+def imp_euler_events(f, x, y, c, N, events, h=None, xtol=1e-12, stats=None):
+    """
+    Integrates dy/dx = f(x, y) from x to c once with the Improved Euler method
+    while watching event functions g(x, y) for sign changes. Each crossing is
+    refined by bisection on the cubic Hermite interpolant of the step it falls in.
+
+    Parameters:
+    - f: The function f(x, y) defining the differential equation dy/dx = f(x, y).
+    - x: Initial x-value.
+    - y: Initial y-value.
+    - c: x-value to integrate to.
+    - N: Number of steps.
+    - events: Sequence of event functions g(x, y). An optional `terminal`
+      attribute stops the integration at the event's first crossing, and an
+      optional `direction` attribute (1, -1 or 0) filters crossings by sign.
+      See level_event.
+    - h: Step size (default is (c - x) / N).
+    - xtol: Absolute tolerance on the refined crossing locations.
+    - stats: SolverStats filled in with the f evaluations, steps and timings
+      (optional); the time spent locating crossings is also kept as "events".
+
+    Returns:
+    - x_events: List with, for each event, the list of x values where it fired.
+    - y_events: List with, for each event, the matching y values.
+    - x, y: The final state, which is the terminal crossing if one fired.
+    """
+    h = h if h else (c - x) / N
+    f = counted(stats, f)
+    with phase(stats, "total"):
+        return _imp_euler_events(f, x, y, N, events, h, xtol, stats)
+
+def _imp_euler_events(f, x, y, N, events, h, xtol, stats):
+    x_events = [[] for _ in events]
+    y_events = [[] for _ in events]
+    terminal = [getattr(g, "terminal", False) for g in events]
+    direction = [getattr(g, "direction", 0) for g in events]
+
+    F = f(x, y)
+    g_prev = [g(x, y) for g in events]
+    for i in range(N):
+        G = f(x + h, (y + h * F))
+        x_next = x + h
+        y_next = y + h * (F + G)/2
+        F_next = f(x_next, y_next)
+        g_next = [g(x_next, y_next) for g in events]
+        if stats is not None:
+            stats.naccept += 1
+
+        hits = []
+        for j, g in enumerate(events):
+            if not _fires(g_prev[j], g_next[j], direction[j]):
+                continue
+            # Bisection on the local interpolant; the bracket keeps g(lo) on
+            # the same side as g_prev
+            with phase(stats, "events"):
+                lo, hi = x, x_next
+                while abs(hi - lo) > xtol:
+                    mid = (lo + hi) / 2
+                    g_mid = g(mid, _hermite(x, y, F, x_next, y_next, F_next, mid))
+                    if (g_mid < 0) == (g_prev[j] < 0) and g_mid != 0:
+                        lo = mid
+                    else:
+                        hi = mid
+            hits.append((hi, j))
+
+        for x_root, j in sorted(hits, key=lambda hit: hit[0] * np.sign(h)):
+            y_root = _hermite(x, y, F, x_next, y_next, F_next, x_root)
+            x_events[j].append(x_root)
+            y_events[j].append(y_root)
+            if terminal[j]:
+                return x_events, y_events, x_root, y_root
+
+        x, y, F, g_prev = x_next, y_next, F_next, g_next
+    return x_events, y_events, x, y
+
+## given f, intial and a range find the value of x that results i specifies value y
+def find_y(f, x0, y0, y, a, b, N=1000):
+    """
+    Finds the first x in [a, b) where the Improved Euler solution reaches y.
+
+    Parameters:
+    - f: The function f(x, y) defining the differential equation dy/dx = f(x, y).
+    - x0: Initial x-value.
+    - y0: Initial y-value.
+    - y: Target y value, or a sequence of target values.
+    - a: Start of the range for x.
+    - b: End of the range for x.
+    - N: Number of steps used to integrate from x0 to b (default is 1000).
+
+    Returns:
+    - The x value of the first crossing, or None if y is not reached. When y
+      is a sequence, a list with one such entry per target.
+    """
+    from .reducers import FirstCrossing
+    targets = np.atleast_1d(y)
+    # A single target can stop at its first crossing
+    crossings = [FirstCrossing(t, start=a, terminal=targets.size == 1) for t in targets]
+    _, _, found = imp_euler_reduce(f, x0, y0, b, N, crossings)
+    found = [xe if xe is not None and xe < b else None for xe in found]
+    return found if np.ndim(y) else found[0]
+
+def main():
+    print(find_y(lambda x,y: (x + y + 1)**2, 0,-1,0,0,1.4))
+
+if __name__ == "__main__":
+    main()
+
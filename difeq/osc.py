@@ -0,0 +1,182 @@
+import os
+
+import numpy as np
+
+from .butcher import RK4, explicit_rk
+
+def compute_coefficients(m, b, k, Omega):
+    """
+    Compute the coefficients A and B for the synchronous solution.
+    
+    Parameters:
+    m     : Mass (constant)
+    b     : Damping coefficient
+    k     : Spring constant
+    Omega : Driving frequency (array)
+    
+    Returns:
+    A     : Coefficient for cosine term (array)
+    B     : Coefficient for sine term (array)
+    """
+    denominator = b**2 * Omega**2 + (k - m * Omega**2)**2
+    A = (k - m * Omega**2) / denominator
+    B = (b * Omega) / denominator
+    return A, B
+
+def resonance_sweep(m, b, k, Omega, chunk_size=1_000_000, dtype=np.float64):
+    """
+    Evaluate compute_coefficients over full broadcast grids of parameters.
+    
+    m, b, k and Omega are broadcast against each other (e.g. b[:, None] with
+    Omega[None, :]) and evaluated in blocks of about chunk_size points along
+    the leading axis, so the temporaries stay bounded however large the grid is.
+    
+    Parameters:
+    m, b, k, Omega : Scalars or arrays, as in compute_coefficients
+    chunk_size     : Number of grid points evaluated at a time
+    dtype          : Output and working precision (e.g. np.float32)
+    
+    Returns:
+    A     : Coefficient for cosine term (array of the broadcast shape)
+    B     : Coefficient for sine term (array of the broadcast shape)
+    """
+    inputs = np.broadcast_arrays(*(np.asarray(p) for p in (m, b, k, Omega)))
+    shape = inputs[0].shape
+    if not shape:
+        return tuple(np.asarray(c, dtype=dtype)
+                     for c in compute_coefficients(*(p.astype(dtype) for p in inputs)))
+    A = np.empty(shape, dtype=dtype)
+    B = np.empty(shape, dtype=dtype)
+    # Chunk along the leading axis; the slices of the broadcast inputs are views
+    rows = max(1, chunk_size // max(1, A[0].size))
+    for start in range(0, shape[0], rows):
+        part = slice(start, start + rows)
+        A[part], B[part] = compute_coefficients(*(p[part].astype(dtype) for p in inputs))
+    return A, B
+
+def resonance_peaks(m, b, k):
+    """
+    Analytic resonance peak of the amplitude sqrt(A**2 + B**2) = 1/sqrt(D),
+    where D(Omega) = b**2 Omega**2 + (k - m Omega**2)**2 is the denominator
+    in compute_coefficients. Broadcasts over arrays of m, b and k.
+    
+    D is a quadratic in u = Omega**2 with its minimum at
+    u = k/m - b**2/(2 m**2); when that is not positive the peak is at Omega = 0.
+    The bandwidth is the distance between the half-power frequencies,
+    where D = 2 * D_min.
+    
+    Parameters:
+    m, b, k : Scalars or arrays, as in compute_coefficients
+    
+    Returns:
+    Omega_peak : Driving frequency of the peak
+    amplitude  : Peak amplitude (inf for b = 0)
+    bandwidth  : Full width of the peak at half power (0 for b = 0)
+    """
+    m, b, k = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (m, b, k)))
+    u_peak = k / m - b**2 / (2 * m**2)
+    underdamped = u_peak > 0
+    u_peak = np.where(underdamped, u_peak, 0.0)
+    D_min = np.where(underdamped, b**2 * k / m - b**4 / (4 * m**2), k**2)
+    with np.errstate(divide="ignore"):
+        amplitude = 1 / np.sqrt(D_min)
+    # Half-power points: m^2 u^2 + (b^2 - 2 m k) u + k^2 - 2 D_min = 0
+    p = 2 * m * k - b**2
+    disc = np.sqrt(np.maximum(p**2 - 4 * m**2 * (k**2 - 2 * D_min), 0))
+    u_hi = (p + disc) / (2 * m**2)
+    u_lo = np.maximum((p - disc) / (2 * m**2), 0)
+    bandwidth = np.sqrt(u_hi) - np.sqrt(u_lo)
+    return np.sqrt(u_peak), amplitude, bandwidth
+
+def oscillator_rhs(t, u, m, b, k, Omega):
+    """
+    Right-hand side of m x'' + b x' + k x = cos(Omega t) as a first-order system.
+    
+    Parameters:
+    t     : Time
+    u     : State [x, x']
+    m, b, k, Omega : As in compute_coefficients
+    
+    Returns:
+    [x', x''] (array)
+    """
+    return np.array([u[1], (np.cos(Omega * t) - b * u[1] - k * u[0]) / m])
+
+def simulate(m, b, k, Omega, x0, v0, t_end, h=0.01, tableau=RK4):
+    """
+    Integrate the driven oscillator directly with an explicit Runge-Kutta method.
+    
+    Parameters:
+    m, b, k, Omega : As in compute_coefficients (Omega a single frequency)
+    x0      : Initial displacement
+    v0      : Initial velocity
+    t_end   : Final time
+    h       : Step size
+    tableau : Butcher tableau to use (see butcher.TABLEAUX)
+    
+    Returns:
+    ts      : Times (array)
+    xs      : Displacements (array)
+    vs      : Velocities (array)
+    """
+    steps = int(np.ceil(t_end / h))
+    ts, us = explicit_rk(oscillator_rhs, 0.0, [x0, v0], t_end / steps, steps,
+                         tableau, (m, b, k, Omega))
+    return ts, us[:, 0], us[:, 1]
+
+def main(output=None):
+    # Parameters
+    m = 1       # Mass
+    b1 = 0.1    # Damping coefficient for Case 1
+    b2 = 0      # Damping coefficient for Case 2 (Undamped)
+    k = 25      # Spring constant
+    Omega = np.linspace(4, 6, 400)  # Driving frequency from 4 to 6 with fine resolution
+
+    # Compute coefficients for both cases
+    A1, B1 = compute_coefficients(m, b1, k, Omega)
+    A2, B2 = compute_coefficients(m, b2, k, Omega)
+
+    # Write both plots to files (headless) when an output path is given:
+    # <name>-damped<ext> and <name>-undamped<ext>
+    if output is not None:
+        from .render import render
+        stem, ext = os.path.splitext(output)
+        for case, A, B, ylim in (("damped", A1, B1, (-1.5, 2.5)), ("undamped", A2, B2, (-3, 3))):
+            render(f"{stem}-{case}{ext}", [(Omega, A, 'A(Ω)', 'b-'), (Omega, B, 'B(Ω)', 'g-')],
+                   vlines=[(5, 'Resonance at Ω=5')], xlim=(4, 6), ylim=ylim,
+                   title=f'Coefficients A and B vs. Driving Frequency Ω ({case.capitalize()})',
+                   xlabel='Driving Frequency Ω', ylabel='Coefficient Value')
+        return
+
+    import matplotlib.pyplot as plt
+
+    # Plot 1: Damped Case (b=0.1)
+    plt.figure(figsize=(12, 6))
+    plt.plot(Omega, A1, label='A(Ω)', color='blue')
+    plt.plot(Omega, B1, label='B(Ω)', color='green')
+    plt.axvline(x=5, color='red', linestyle='--', label='Resonance at Ω=5')
+    plt.title('Coefficients A and B vs. Driving Frequency Ω (Damped)')
+    plt.xlabel('Driving Frequency Ω')
+    plt.ylabel('Coefficient Value')
+    plt.legend()
+    plt.grid(True)
+    plt.ylim(-1.5, 2.5)  # Based on the provided graph options
+    plt.xlim(4, 6)
+    plt.show()
+
+    # Plot 2: Undamped Case (b=0)
+    plt.figure(figsize=(12, 6))
+    plt.plot(Omega, A2, label='A(Ω)', color='blue')
+    plt.plot(Omega, B2, label='B(Ω)', color='green')
+    plt.axvline(x=5, color='red', linestyle='--', label='Resonance at Ω=5')
+    plt.title('Coefficients A and B vs. Driving Frequency Ω (Undamped)')
+    plt.xlabel('Driving Frequency Ω')
+    plt.ylabel('Coefficient Value')
+    plt.legend()
+    plt.grid(True)
+    plt.ylim(-3, 3)  # Adjusted to visualize blow-up at resonance
+    plt.xlim(4, 6)
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import numpy as np
+
+from .dense import HermiteSolution
+
+class Reducer:
+    """
+    Base class of the streaming reductions: a solver calls update with each
+    new block of points as it steps, so the trajectory is never stored.
+
+    The last point of every block is remembered, so the step between two
+    blocks is seen as well. Steps are interpolated with the cubic Hermite
+    polynomial through y and the slopes f (see dense.HermiteSolution); if
+    the solver passes no slopes they are estimated with np.gradient.
+
+    Parameters:
+    component : Index of the y component to reduce, for vector-valued y
+    """
+
+    terminal = False
+    done = False
+
+    def __init__(self, component=None):
+        self.component = component
+        self._last = None
+
+    def _select(self, values):
+        values = np.asarray(values, dtype=float)
+        if self.component is not None:
+            return values.reshape(len(values), -1)[:, self.component]
+        return values
+
+    def update(self, xs, ys, fs=None):
+        """
+        Adds the points (xs[i], ys[i]) with slopes fs[i] to the reduction.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = self._select(ys)
+        if fs is None:
+            fs = np.gradient(ys, xs, axis=0) if len(xs) > 1 else np.zeros_like(ys)
+        fs = self._select(fs)
+        if self._last is not None:
+            x_ext = np.concatenate([[self._last[0]], xs])
+            y_ext = np.concatenate([[self._last[1]], ys])
+            f_ext = np.concatenate([[self._last[2]], fs])
+        else:
+            x_ext, y_ext, f_ext = xs, ys, fs
+        if len(xs):
+            self._last = (xs[-1], ys[-1], fs[-1])
+            self._reduce(xs, ys, x_ext, y_ext, f_ext)
+
+    def _reduce(self, xs, ys, x_ext, y_ext, f_ext):
+        raise NotImplementedError
+
+class RunningMax(Reducer):
+    """
+    Running maximum of y and where it occurs, optionally only over a window
+    [start, stop]. With dense=True the maximum is also searched inside the
+    steps on the interpolant, otherwise only at the points.
+
+    Result:
+    (max_y, max_x), or (-inf, nan) before any point in the window
+    """
+
+    sign = 1
+
+    def __init__(self, start=None, stop=None, dense=True, component=None):
+        super().__init__(component)
+        self.start = -np.inf if start is None else start
+        self.stop = np.inf if stop is None else stop
+        self.dense = dense
+        self.best_y = -np.inf
+        self.best_x = np.nan
+
+    def _offer(self, y, x):
+        if self.sign * y > self.sign * self.best_y or np.isnan(self.best_x):
+            self.best_y, self.best_x = y, x
+
+    def _reduce(self, xs, ys, x_ext, y_ext, f_ext):
+        lo = max(self.start, min(x_ext[0], x_ext[-1]))
+        hi = min(self.stop, max(x_ext[0], x_ext[-1]))
+        if lo > hi:
+            return
+        if self.dense and len(x_ext) > 1:
+            sol = HermiteSolution(x_ext, y_ext, f_ext)
+            y, x = sol.maximum(lo, hi) if self.sign > 0 else sol.minimum(lo, hi)
+            self._offer(y, x)
+            return
+        inside = (xs >= lo - 1e-12 * max(1.0, abs(lo))) & (xs <= hi)
+        if inside.any():
+            i = np.argmax(self.sign * np.where(inside, ys, -self.sign * np.inf))
+            self._offer(ys[i], xs[i])
+
+    @property
+    def result(self):
+        return self.best_y, self.best_x
+
+class RunningMin(RunningMax):
+    """
+    Running minimum of y and where it occurs; see RunningMax.
+
+    Result:
+    (min_y, min_x), or (inf, nan) before any point in the window
+    """
+
+    sign = -1
+
+    def __init__(self, start=None, stop=None, dense=True, component=None):
+        super().__init__(start, stop, dense, component)
+        self.best_y = np.inf
+
+class FirstCrossing(Reducer):
+    """
+    First x >= start where y crosses `level`, located on the interpolant.
+    A first point already at the level counts as a crossing there. With
+    terminal=True the solver may stop once it is found.
+
+    Result:
+    The x value of the crossing, or None if y has not reached the level
+    """
+
+    def __init__(self, level, start=None, terminal=False, component=None):
+        super().__init__(component)
+        self.level = level
+        self.start = -np.inf if start is None else start
+        self.terminal = terminal
+        self.x = None
+
+    def _reduce(self, xs, ys, x_ext, y_ext, f_ext):
+        if not self.done and len(x_ext) == len(xs) and xs[0] >= self.start and ys[0] == self.level:
+            # The brackets of roots are half-open, so they never report the
+            # very first point of the trajectory
+            self.x = float(xs[0])
+            self.done = True
+        if self.done or len(x_ext) < 2 or max(x_ext[0], x_ext[-1]) < self.start:
+            return
+        roots = HermiteSolution(x_ext, y_ext, f_ext).roots(self.level)
+        roots = roots[roots >= self.start]
+        if len(roots):
+            self.x = float(roots[0])
+            self.done = True
+
+    @property
+    def result(self):
+        return self.x
+
+class Integral(Reducer):
+    """
+    Integral of y over the integration interval, by integrating the cubic
+    Hermite interpolant exactly: each step contributes
+    h (y0 + y1) / 2 + h^2 (f0 - f1) / 12, which is fourth-order accurate.
+
+    Result:
+    The integral (same shape as one y value)
+    """
+
+    def __init__(self, component=None):
+        super().__init__(component)
+        self.total = 0.0
+
+    def _reduce(self, xs, ys, x_ext, y_ext, f_ext):
+        if len(x_ext) < 2:
+            return
+        h = np.diff(x_ext).reshape((-1,) + (1,) * (y_ext.ndim - 1))
+        self.total = self.total + np.sum(h * (y_ext[:-1] + y_ext[1:]) / 2
+                                         + h**2 * (f_ext[:-1] - f_ext[1:]) / 12, axis=0)
+
+    @property
+    def result(self):
+        return self.total
+
+class MeanVariance(Reducer):
+    """
+    Mean and (population) variance of y over the points, combined block by
+    block with Welford's update in the parallel form of Chan et al., which
+    stays accurate for long runs.
+
+    Result:
+    (mean, variance)
+    """
+
+    def __init__(self, component=None):
+        super().__init__(component)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _reduce(self, xs, ys, x_ext, y_ext, f_ext):
+        n_b = len(ys)
+        mean_b = ys.mean(axis=0)
+        m2_b = ((ys - mean_b) ** 2).sum(axis=0)
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * n_b / n
+        self.m2 = self.m2 + m2_b + delta**2 * self.count * n_b / n
+        self.count = n
+
+    @property
+    def result(self):
+        variance = self.m2 / self.count if self.count else np.nan
+        return self.mean, variance
+
+def feed(reducers, xs, ys, fs=None):
+    """
+    Passes a block of points to every reducer. Returns True when a terminal
+    reducer is done, so the solver can stop.
+    """
+    for reducer in reducers:
+        reducer.update(xs, ys, fs)
+    return any(r.terminal and r.done for r in reducers)
+
+def results(reducers):
+    """
+    The result of every reducer, in order.
+    """
+    return [reducer.result for reducer in reducers]
@@ -0,0 +1,222 @@
+import os
+
+import numpy as np
+
+def lttb(xs, ys, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a trajectory.
+
+    The first and last points are kept, the rest is split into n_out - 2
+    buckets of consecutive points, and from each bucket the point forming
+    the largest triangle with the point kept from the previous bucket and
+    the mean of the next bucket is kept. This preserves the visual shape
+    (peaks, turning points) of the curve.
+
+    Parameters:
+    xs    : Array of x values
+    ys    : Array of y values (1-D)
+    n_out : Number of points to keep
+
+    Returns:
+    xs, ys: The kept points
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    n = len(xs)
+    if n_out >= n or n_out < 3:
+        return xs, ys
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        if k + 2 < len(edges):
+            nxt = slice(edges[k + 1], edges[k + 2])
+            x_next, y_next = xs[nxt].mean(), ys[nxt].mean()
+        else:
+            x_next, y_next = xs[-1], ys[-1]
+        x_prev, y_prev = xs[keep[k]], ys[keep[k]]
+        area = np.abs((x_prev - x_next) * (ys[lo:hi] - y_prev)
+                      - (x_prev - xs[lo:hi]) * (y_next - y_prev))
+        keep[k + 1] = lo + np.argmax(area)
+    return xs[keep], ys[keep]
+
+def _component(ys, component):
+    ys = np.asarray(ys)
+    if ys.ndim > 1:
+        return ys.reshape(len(ys), -1)[:, component]
+    return ys
+
+def minmax_chunks(chunks, n_points, buckets, component=0):
+    """
+    Min/max-per-bucket downsampling of a streamed trajectory.
+
+    The n_points points are split by index into `buckets` buckets (one per
+    horizontal pixel, say) and only the lowest and highest point of each are
+    kept, so every spike survives. The chunks are reduced one at a time, so
+    the trajectory never has to be in memory at once.
+
+    Parameters:
+    chunks    : Iterable of (xs, ys) chunks, e.g. from butcher.explicit_rk_chunks
+                or memmap_chunks
+    n_points  : Total number of points in the stream
+    buckets   : Number of buckets
+    component : Column of vector-valued y to reduce
+
+    Returns:
+    xs, ys    : Up to 2 * buckets points, in order of index
+    """
+    buckets = max(1, min(buckets, n_points))
+    lo_y = np.full(buckets, np.inf)
+    hi_y = np.full(buckets, -np.inf)
+    lo_i = np.zeros(buckets, dtype=np.int64)
+    hi_i = np.zeros(buckets, dtype=np.int64)
+    lo_x = np.full(buckets, np.nan)
+    hi_x = np.full(buckets, np.nan)
+    start = 0
+    for xs, ys in chunks:
+        xs = np.asarray(xs, dtype=float)
+        ys = _component(ys, component).astype(float)
+        index = start + np.arange(len(xs))
+        bucket = index * buckets // n_points
+        # Buckets are contiguous runs of the chunk
+        first = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        b = bucket[first]
+        for reduce, arg, best_y, best_i, best_x, better in (
+                (np.minimum.reduceat, np.argmin, lo_y, lo_i, lo_x, np.less),
+                (np.maximum.reduceat, np.argmax, hi_y, hi_i, hi_x, np.greater)):
+            value = reduce(ys, first)
+            # Position of the first occurrence of the extreme value in each run
+            run = np.repeat(np.arange(len(first)), np.diff(np.r_[first, len(ys)]))
+            hits = np.flatnonzero(ys == value[run])
+            pos = hits[np.searchsorted(run[hits], np.arange(len(first)))]
+            update = better(value, best_y[b])
+            best_y[b[update]] = value[update]
+            best_i[b[update]] = index[pos[update]]
+            best_x[b[update]] = xs[pos[update]]
+        start += len(xs)
+    filled = np.isfinite(lo_y)
+    first_lo = lo_i <= hi_i
+    # Emit each bucket's two points in index order, once if they coincide
+    x = np.stack([np.where(first_lo, lo_x, hi_x), np.where(first_lo, hi_x, lo_x)], axis=1)
+    y = np.stack([np.where(first_lo, lo_y, hi_y), np.where(first_lo, hi_y, lo_y)], axis=1)
+    single = lo_i == hi_i
+    keep = np.stack([filled, filled & ~single], axis=1)
+    return x[keep], y[keep]
+
+def minmax(xs, ys, buckets, component=0):
+    """
+    minmax_chunks for a trajectory that is already an array (or memmap).
+    """
+    return minmax_chunks(memmap_chunks(xs, ys), len(xs), buckets, component)
+
+def memmap_chunks(xs, ys, chunk_size=1 << 20):
+    """
+    Splits a (memory-mapped) trajectory into chunks, e.g. the arrays returned
+    by stream.load_npy, so that only chunk_size rows are read at a time.
+    """
+    for start in range(0, len(xs), chunk_size):
+        yield xs[start:start + chunk_size], ys[start:start + chunk_size]
+
+def decimate(xs, ys, n_out, method="minmax", component=0):
+    """
+    Downsamples a trajectory to about n_out points with "minmax" (n_out / 2
+    buckets), "lttb", or None for no downsampling.
+    """
+    if method is None or len(xs) <= n_out:
+        return np.asarray(xs), _component(ys, component)
+    if method == "minmax":
+        return minmax(xs, ys, n_out // 2, component)
+    if method == "lttb":
+        return lttb(xs, _component(ys, component), n_out)
+    raise ValueError(f"unknown method {method!r}, expected 'minmax', 'lttb' or None")
+
+def render(path, lines, points=(), title=None, xlabel="x", ylabel="y", width=1200,
+           height=600, dpi=100, xlim=None, ylim=None, hlines=(), vlines=()):
+    """
+    Renders line plots to an image file without a display.
+
+    The figure is drawn on matplotlib's Agg canvas directly, so no GUI
+    backend is touched and nothing blocks; the format follows the file
+    extension (.png, .svg, .pdf, ...). Lines are drawn as given, so decimate
+    long trajectories first (see decimate and minmax_chunks).
+
+    Parameters:
+    path    : Output file
+    lines   : List of (xs, ys, label) or (xs, ys, label, style) line series
+    points  : List of (x, y, label) single points to mark
+    title   : Plot title
+    xlabel  : Label of the x axis
+    ylabel  : Label of the y axis
+    width   : Image width in pixels
+    height  : Image height in pixels
+    dpi     : Resolution
+    xlim    : (left, right) limits of the x axis
+    ylim    : (bottom, top) limits of the y axis
+    hlines  : List of (y, label) horizontal reference lines
+    vlines  : List of (x, label) vertical reference lines
+
+    Returns:
+    path    : The written file
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    for line in lines:
+        xs, ys, label = line[:3]
+        style = line[3] if len(line) > 3 else "-"
+        ax.plot(xs, ys, style, label=label, linewidth=1)
+    for x, y, label in points:
+        ax.plot(x, y, "ro", label=label)
+    for y, label in hlines:
+        ax.axhline(y=y, color="r", linestyle="--", label=label)
+    for x, label in vlines:
+        ax.axvline(x=x, color="r", linestyle="--", label=label)
+    if xlim is not None:
+        ax.set_xlim(*xlim)
+    if ylim is not None:
+        ax.set_ylim(*ylim)
+    ax.set_title(title or "")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend()
+    fig.savefig(path)
+    return path
+
+def render_npy(npy_path, path, component=0, method="minmax", n_out=None, label=None,
+               **kwargs):
+    """
+    Renders a trajectory file written by stream.write_npy, reading it in
+    chunks, so files far larger than memory render in one pass.
+
+    Parameters:
+    npy_path  : Trajectory file
+    path      : Output image file
+    component : Column of vector-valued y to plot
+    method    : "minmax" (streamed), or "lttb" (applied to the min/max
+                reduction, which keeps it within memory)
+    n_out     : Number of points to keep (default: twice the image width)
+    label     : Legend label of the line
+    kwargs    : Passed on to render
+
+    Returns:
+    path      : The written file
+    """
+    from .stream import load_npy
+
+    xs, ys = load_npy(npy_path)
+    n_out = n_out or 2 * kwargs.get("width", 1200)
+    # Reduce to a few points per output point first; LTTB then picks from those
+    buckets = n_out // 2 if method == "minmax" else min(len(xs), 4 * n_out)
+    x, y = minmax_chunks(memmap_chunks(xs, ys), len(xs), buckets, component)
+    if method == "lttb":
+        x, y = lttb(x, y, n_out)
+    elif method != "minmax":
+        raise ValueError(f"unknown method {method!r}, expected 'minmax' or 'lttb'")
+    label = label or os.path.basename(npy_path)
+    return render(path, [(x, y, label)], **kwargs)
@@ -0,0 +1,40 @@
+from .butcher import RK4, explicit_rk
+
+def rk4(f, x0, y0, h, steps):
+    """
+    Fourth-order Runge-Kutta method.
+
+    Parameters:
+    f     : Function representing the ODE y' = f(x, y)
+    x0    : Initial x value
+    y0    : Initial y value
+    h     : Step size
+    steps : Number of steps to take
+
+    Returns:
+    (x, y): Tuple containing arrays of x and y values
+    """
+    return explicit_rk(f, x0, y0, h, steps, RK4)
+
+# Define the ODE
+def f(x, y):
+    return x + 3 - y
+
+def main():
+    # Initial conditions
+    x0 = 0
+    y0 = 12
+    h = 0.4
+    x_target = 0
+    steps = int((x_target - x0) / h)
+
+    # Perform RK4
+    xs, ys = rk4(f, x0, y0, h, steps)
+
+    # Extract the value at x = 1
+    phi_K_1 = ys[-1]
+
+    print(f"Approximation using RK4 at x = {x_target}: phi_K(1) = {phi_K_1:.6f}")
+
+if __name__ == "__main__":
+    main()
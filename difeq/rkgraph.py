@@ -0,0 +1,105 @@
+import numpy as np
+
+from .butcher import RK4, explicit_rk, explicit_rk_dense, explicit_rk_reduce
+from .reducers import RunningMax
+
+def rk4(f, x0, y0, h, steps):
+    """
+    Fourth-order Runge-Kutta method.
+    
+    Parameters:
+    f     : Function representing the ODE y' = f(x, y)
+    x0    : Initial x value
+    y0    : Initial y value
+    h     : Step size
+    steps : Number of steps to take
+    
+    Returns:
+    xs, ys: Arrays of x and y values
+    """
+    return explicit_rk(f, x0, y0, h, steps, RK4)
+
+def f(x, y):
+    """
+    Defines the ODE y' = cos(5y) - x
+    """
+    return np.cos(5*y) - x
+
+def find_max(xs, ys, sol=None):
+    """
+    Finds the maximum y value and its corresponding x value.
+    
+    Parameters:
+    xs : Array of x values
+    ys : Array of y values
+    sol: Optional continuous solution from explicit_rk_dense; when given, the
+         maximum is located inside the steps on its interpolant
+    
+    Returns:
+    max_y : The maximum y value
+    max_x : The x value at which the maximum y occurs
+    """
+    if sol is not None:
+        return sol.maximum()
+    max_index = np.argmax(ys)
+    max_y = ys[max_index]
+    max_x = xs[max_index]
+    return max_y, max_x
+
+def find_max_streaming(f, x0, y0, h, steps):
+    """
+    Same maximum as find_max(xs, ys, sol) for the RK4 solution, but tracked
+    while stepping (see reducers.RunningMax), so no trajectory is stored.
+
+    Returns:
+    max_y : The maximum y value
+    max_x : The x value at which it occurs
+    """
+    _, _, [(max_y, max_x)] = explicit_rk_reduce(f, x0, y0, h, steps, [RunningMax()], RK4)
+    return max_y, max_x
+
+def main(output=None):
+    # Initial conditions
+    x0 = 0
+    y0 = 7
+    h = 0.4
+    x_end = 12
+    steps = int((x_end - x0)/h)
+    
+    # Perform RK4, keeping the continuous extension between steps
+    sol = explicit_rk_dense(f, x0, y0, h, steps, RK4)
+    xs, ys = sol.xs, sol.ys
+    
+    # Find maximum y and its location
+    max_y, max_x = find_max(xs, ys, sol)
+    
+    # Display the results
+    print("Approximate Solution using RK4:")
+    for xi, yi in zip(xs, ys):
+        print(f"x = {xi:.1f}, y = {yi:.6f}")
+    
+    print(f"\nMaximum value of y over [0, 12]: {max_y:.6f}")
+    print(f"Occurs at x = {max_x:.1f}")
+    
+    # Write the plot to a file (headless) when an output path is given
+    if output is not None:
+        from .render import decimate, render
+        x_plot, y_plot = decimate(xs, ys, 2400)
+        render(output, [(x_plot, y_plot, 'RK4 Approximation')], points=[(max_x, max_y, 'Maximum y')],
+               title="Solution of the IVP using Fourth-Order Runge-Kutta Method", width=1200, height=600)
+        return
+
+    # Plot the solution
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(12, 6))
+    plt.plot(xs, ys, 'bo-', label='RK4 Approximation')
+    plt.plot(max_x, max_y, 'ro', label='Maximum y')
+    plt.title("Solution of the IVP using Fourth-Order Runge-Kutta Method")
+    plt.xlabel("x")
+    plt.ylabel("y")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .butcher import RK4, explicit_rk, explicit_rk_dense, explicit_rk_reduce
+from .reducers import RunningMax
 
 def rk4(f, x0, y0, h, x_end):
     """
@@ -8,47 +10,17 @@ def rk4(f, x0, y0, h, x_end):
     Parameters:
     f      : Function representing the ODE y' = f(x, y)
     x0     : Initial x value
-    y0     : Initial y value
+    y0     : Initial y value (scalar, or array for an ensemble)
     h      : Step size
     x_end  : The value of x at which to stop the integration
     
     Returns:
     xs     : Array of x values
-    ys     : Array of y values corresponding to xs
+    ys     : Array of y values corresponding to xs, shape (N + 1,) + shape of y0
     """
     # Calculate the number of steps
     N = int(np.ceil((x_end - x0) / h))
-    
-    # Initialize arrays to store x and y values
-    xs = np.zeros(N + 1)
-    ys = np.zeros(N + 1)
-    
-    # Set initial conditions
-    xs[0] = x0
-    ys[0] = y0
-    
-    # Iterate using RK4
-    for i in range(N):
-        xi = xs[i]
-        yi = ys[i]
-        
-        # Compute RK4 coefficients
-        k1 = h * f(xi, yi)
-        k2 = h * f(xi + h/2, yi + k1/2)
-        k3 = h * f(xi + h/2, yi + k2/2)
-        k4 = h * f(xi + h, yi + k3)
-        
-        # Update y
-        yi_next = yi + (k1 + 2*k2 + 2*k3 + k4) / 6
-        
-        # Update x
-        xi_next = xi + h
-        
-        # Store the next values
-        xs[i + 1] = xi_next
-        ys[i + 1] = yi_next
-        
-    return xs, ys
+    return explicit_rk(f, x0, y0, h, N, RK4)
 
 def f(x, y):
     """
@@ -56,35 +28,52 @@ def f(x, y):
     """
     return (1.8 / x**4) - y**2
 
-def find_max(xs, ys):
+def find_max(xs, ys, sol=None):
     """
     Finds the maximum y value and its corresponding x value.
     
     Parameters:
     xs : Array of x values
     ys : Array of y values
+    sol: Optional continuous solution from explicit_rk_dense; when given, the
+         maximum is located inside the steps on its interpolant
     
     Returns:
     max_y : The maximum y value
     max_x : The x value at which the maximum y occurs
     """
+    if sol is not None:
+        return sol.maximum()
     max_index = np.argmax(ys)
     max_y = ys[max_index]
     max_x = xs[max_index]
     return max_y, max_x
 
-def main():
+def find_max_streaming(f, x0, y0, h, steps):
+    """
+    Same maximum as find_max(xs, ys, sol) for the RK4 solution, but tracked
+    while stepping (see reducers.RunningMax), so no trajectory is stored.
+
+    Returns:
+    max_y : The maximum y value
+    max_x : The x value at which it occurs
+    """
+    _, _, [(max_y, max_x)] = explicit_rk_reduce(f, x0, y0, h, steps, [RunningMax()], RK4)
+    return max_y, max_x
+
+def main(output=None):
     # Initial conditions
     x0 = 0.5
     y0 = -1
     h = 0.01  # Step size
     x_end = 1.5  # End of interval
     
-    # Perform RK4
-    xs, ys = rk4(f, x0, y0, h, x_end)
+    # Perform RK4, keeping the continuous extension between steps
+    sol = explicit_rk_dense(f, x0, y0, h, int(np.ceil((x_end - x0) / h)), RK4)
+    xs, ys = sol.xs, sol.ys
     
     # Find maximum y and its location
-    max_y, max_x = find_max(xs, ys)
+    max_y, max_x = find_max(xs, ys, sol)
     
     # Display the results
     print("Approximate Solution using RK4:")
@@ -94,7 +83,16 @@ def main():
     print(f"\nMaximum value of y over [0.5, 1.5]: {max_y:.6f}")
     print(f"Occurs at x = {max_x:.2f}")
     
+    # Write the plot to a file (headless) when an output path is given
+    if output is not None:
+        from .render import decimate, render
+        x_plot, y_plot = decimate(xs, ys, 2000)
+        render(output, [(x_plot, y_plot, 'RK4 Approximation')], points=[(max_x, max_y, 'Maximum y')],
+               title="Solution of the IVP using Fourth-Order Runge-Kutta Method", width=1000, height=600)
+        return
+
     # (Optional) Plot the solution
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(10, 6))
     plt.plot(xs, ys, 'bo-', label='RK4 Approximation')
     plt.plot(max_x, max_y, 'ro', label='Maximum y')
@@ -0,0 +1,19 @@
+import numpy as np
+
+from .convergence import convergence_study
+
+def main():
+    f = lambda h : ((1 + (h / 2))/(1 - (h / 2)))**(1/h)
+    print("h = 1, 0.1, 0.01, 0.001, 0.0001")
+
+    # All step sizes are evaluated in one vectorized call
+    hs = 10.0 ** -np.arange(0, 6)
+    study = convergence_study(f, hs, exact=np.e, vectorized=True)
+    for h, value in zip(study.hs, study.values):
+        print(f"h = {h:g}, f(h) = {value}")
+
+    print(f"Observed order: {study.order:.2f}")
+    print(f"Richardson extrapolation: {study.extrapolated} (estimated error {study.error:.1e})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+class SolverStats:
+    """
+    Work counters and timings filled in by a solver run.
+
+    Pass an instance as the stats= argument of a solver; the solver adds to
+    it, so one instance can also accumulate several runs. Time spent inside
+    f (and the Jacobian) is measured by the wrappers from count_rhs and
+    count_jac, so overhead = total - rhs - jac is the time spent in the
+    solver itself.
+
+    Attributes:
+    nfev    : Number of calls of f (a vectorized call over a batch counts once)
+    njev    : Number of Jacobian evaluations
+    nlu     : Number of LU factorizations
+    nnewton : Number of Newton iterations
+    naccept : Number of accepted steps
+    nreject : Number of rejected steps
+    times   : Dict {phase: seconds}, e.g. "total", "rhs", "jac", "lu"
+    hook    : Optional function hook(kind, elapsed) called after every
+              f ("rhs") or Jacobian ("jac") evaluation, for custom profiling
+    """
+
+    def __init__(self, hook=None):
+        self.nfev = 0
+        self.njev = 0
+        self.nlu = 0
+        self.nnewton = 0
+        self.naccept = 0
+        self.nreject = 0
+        self.times = {}
+        self.hook = hook
+
+    def add_time(self, name, elapsed):
+        self.times[name] = self.times.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager adding the time spent in its block to times[name].
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def _wrap(self, func, kind, counter):
+        def wrapped(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                setattr(self, counter, getattr(self, counter) + 1)
+                self.add_time(kind, elapsed)
+                if self.hook is not None:
+                    self.hook(kind, elapsed)
+        return wrapped
+
+    def count_rhs(self, f):
+        """
+        Wraps f so every call is counted in nfev and timed under "rhs".
+        """
+        return self._wrap(f, "rhs", "nfev")
+
+    def count_jac(self, jac):
+        """
+        Wraps jac so every call is counted in njev and timed under "jac".
+        """
+        return self._wrap(jac, "jac", "njev")
+
+    @property
+    def overhead(self):
+        """
+        Seconds of "total" not spent evaluating f or the Jacobian.
+        """
+        return self.times.get("total", 0.0) - self.times.get("rhs", 0.0) - self.times.get("jac", 0.0)
+
+    def as_dict(self):
+        """
+        The counters and times as one flat dict, e.g. for a results table.
+        """
+        out = {"nfev": self.nfev, "njev": self.njev, "nlu": self.nlu, "nnewton": self.nnewton,
+               "naccept": self.naccept, "nreject": self.nreject}
+        out.update({f"time_{k}": v for k, v in self.times.items()})
+        out["time_overhead"] = self.overhead
+        return out
+
+    def __repr__(self):
+        counts = ", ".join(f"{k}={v}" for k, v in self.as_dict().items() if not k.startswith("time_"))
+        times = ", ".join(f"{k}={v:.3g}s" for k, v in self.times.items())
+        return f"SolverStats({counts}; {times})"
+
+def phase(stats, name):
+    """
+    stats.phase(name), or a no-op context manager when stats is None.
+    """
+    return nullcontext() if stats is None else stats.phase(name)
+
+def counted(stats, f):
+    """
+    stats.count_rhs(f), or f itself when stats is None.
+    """
+    return f if stats is None else stats.count_rhs(f)
@@ -0,0 +1,167 @@
+import numpy as np
+
+from .stats import phase
+
+# BDF k advances y_{n+1} = sum_j alpha_j y_{n-j} + h*beta*f(x_{n+1}, y_{n+1}),
+# with alpha listing the coefficient of y_n first
+BDF = {
+    1: ([1], 1),
+    2: ([4/3, -1/3], 2/3),
+    3: ([18/11, -9/11, 2/11], 6/11),
+    4: ([48/25, -36/25, 16/25, -3/25], 12/25),
+    5: ([300/137, -300/137, 200/137, -75/137, 12/137], 60/137),
+}
+
+METHODS = {
+    "backward_euler": 1,
+    "trapezoidal": None,
+    "bdf1": 1,
+    "bdf2": 2,
+    "bdf3": 3,
+    "bdf4": 4,
+    "bdf5": 5,
+}
+
+def finite_difference_jacobian(f, x, y, f0=None, args=()):
+    """
+    Forward-difference approximation of the Jacobian df/dy.
+
+    Parameters:
+    f    : Function representing the ODE y' = f(x, y, *args), y a 1-D array
+    x    : x value
+    y    : y value (1-D array)
+    f0   : f(x, y) if already known
+    args : Extra arguments passed to f
+
+    Returns:
+    J    : Array of shape (len(y), len(y))
+    """
+    f0 = np.atleast_1d(f(x, y, *args)) if f0 is None else f0
+    J = np.empty((y.size, y.size))
+    y_pert = y.copy()
+    for j in range(y.size):
+        delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[j]))
+        y_pert[j] = y[j] + delta
+        J[:, j] = (np.atleast_1d(f(x, y_pert, *args)) - f0) / delta
+        y_pert[j] = y[j]
+    return J
+
+def implicit_solve(f, x0, y0, h, steps, method="bdf2", jac=None, args=(),
+                   tol=1e-10, max_newton=8, stats=None):
+    """
+    Fixed-step implicit solver for stiff ODEs.
+
+    Each step solves its implicit equation with a simplified Newton iteration.
+    The iteration matrix I - h*beta*J is factorized once and reused across
+    steps; the Jacobian is only re-evaluated and the matrix refactorized when
+    Newton fails to converge. BDF methods of order k start up with orders
+    1, ..., k-1 for their first steps, so on non-stiff problems the startup
+    error can dominate for k > 2.
+
+    Parameters:
+    f          : Function representing the ODE y' = f(x, y, *args), or a
+                 scalar SymPy expression in the symbols x and y, whose exact
+                 Jacobian is then generated as well
+    x0         : Initial x value
+    y0         : Initial y value (scalar or 1-D array)
+    h          : Step size
+    steps      : Number of steps to take
+    method     : "backward_euler", "trapezoidal", or "bdf1" to "bdf5"
+    jac        : Function jac(x, y, *args) returning df/dy (default: finite
+                 differences)
+    args       : Extra arguments passed to f and jac
+    tol        : Newton convergence tolerance, relative to 1 + |y|
+    max_newton : Maximum Newton iterations before refreshing the Jacobian
+    stats      : SolverStats filled in with the f and Jacobian evaluations,
+                 Newton iterations, LU factorizations and timings (optional)
+
+    Returns:
+    xs         : Array of x values, shape (steps + 1,)
+    ys         : Array of y values, shape (steps + 1,) + shape of y0
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {sorted(METHODS)}")
+    if hasattr(f, "free_symbols"):
+        from .symcompile import compile_jacobian, compile_rhs
+        jac = compile_jacobian(f) if jac is None else jac
+        f = compile_rhs(f)
+    if stats is not None:
+        f = stats.count_rhs(f)
+        jac = None if jac is None else stats.count_jac(jac)
+        with stats.phase("total"):
+            return _implicit_solve(f, x0, y0, h, steps, method, jac, args, tol, max_newton, stats)
+    return _implicit_solve(f, x0, y0, h, steps, method, jac, args, tol, max_newton, stats)
+
+def _implicit_solve(f, x0, y0, h, steps, method, jac, args, tol, max_newton, stats):
+    from scipy.linalg import lu_factor, lu_solve
+
+    order = METHODS[method]
+    scalar = np.ndim(y0) == 0
+
+    def rhs(x, y):
+        return np.atleast_1d(f(x, y[0] if scalar else y, *args))
+
+    def jacobian(x, y, f0=None):
+        if jac is None:
+            if stats is not None:
+                stats.njev += 1
+            return finite_difference_jacobian(rhs, x, y, f0)
+        return np.atleast_2d(jac(x, y[0] if scalar else y, *args))
+
+    xs = x0 + h * np.arange(steps + 1)
+    ys = np.empty((steps + 1, np.size(y0)))
+    ys[0] = np.atleast_1d(y0)
+    I = np.eye(ys.shape[1])
+
+    # f at the current point is only needed by the trapezoidal rule
+    f_n = rhs(xs[0], ys[0]) if order is None else None
+    J = jacobian(xs[0], ys[0], f_n)
+    factors = {}  # LU of I - h*beta*J for each beta in use
+
+    for n in range(steps):
+        x_next = xs[n + 1]
+        if order is None:
+            beta = 1/2
+            known = ys[n] + h / 2 * f_n
+        else:
+            alpha, beta = BDF[min(order, n + 1)]
+            known = sum(a * ys[n - j] for j, a in enumerate(alpha))
+
+        # Predictor: linear extrapolation from the last two points
+        z = 2 * ys[n] - ys[n - 1] if n > 0 else ys[n].copy()
+        for refresh in (False, True):
+            if refresh:
+                J = jacobian(xs[n], ys[n], f_n)
+                factors.clear()
+                z = ys[n].copy()
+            if beta not in factors:
+                with phase(stats, "lu"):
+                    factors[beta] = lu_factor(I - h * beta * J)
+                if stats is not None:
+                    stats.nlu += 1
+            converged = False
+            dz_prev = None
+            for _ in range(max_newton):
+                f_z = rhs(x_next, z)
+                dz = lu_solve(factors[beta], z - h * beta * f_z - known)
+                z = z - dz
+                if stats is not None:
+                    stats.nnewton += 1
+                dz_norm = np.max(np.abs(dz))
+                if dz_norm <= tol * (1 + np.max(np.abs(z))):
+                    converged = True
+                    break
+                if dz_prev is not None and dz_norm > dz_prev:
+                    break  # diverging: refresh the Jacobian
+                dz_prev = dz_norm
+            if converged:
+                break
+        else:
+            raise RuntimeError(f"Newton iteration failed to converge at x = {x_next}")
+
+        ys[n + 1] = z
+        if stats is not None:
+            stats.naccept += 1
+        if order is None:
+            f_n = rhs(x_next, z)
+    return xs, (ys[:, 0] if scalar else ys)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from .butcher import RK4, explicit_rk_chunks
+
+def write_npy(path, chunks, n_points, y_shape=()):
+    """
+    Writes a stream of (xs, ys) chunks into a preallocated memory-mapped .npy
+    file, one row [x, y...] per point, without holding the stream in memory.
+
+    Parameters:
+    path     : Output .npy file
+    chunks   : Iterable of (xs, ys) chunks, e.g. from butcher.explicit_rk_chunks
+    n_points : Total number of points the chunks will produce
+    y_shape  : Shape of a single y value (default scalar)
+
+    Returns:
+    out      : The memory-mapped array of shape (n_points, 1 + size of y)
+    """
+    width = 1 + int(np.prod(y_shape))
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=float,
+                                    shape=(n_points, width))
+    row = 0
+    for xs, ys in chunks:
+        out[row:row + len(xs), 0] = xs
+        out[row:row + len(xs), 1:] = ys.reshape(len(xs), -1)
+        row += len(xs)
+    if row != n_points:
+        raise ValueError(f"expected {n_points} points, got {row}")
+    out.flush()
+    return out
+
+def integrate_to_npy(path, f, x0, y0, h, steps, tableau=RK4, args=(), stride=1,
+                     chunk_size=65536):
+    """
+    Integrates with butcher.explicit_rk_chunks straight into a .npy file.
+
+    Column 0 of the file holds x and the remaining columns the (flattened)
+    y of every stride-th step and of the final step. Memory use is bounded
+    by chunk_size, so very long integrations only cost disk space.
+
+    Parameters:
+    path       : Output .npy file
+    f, x0, y0, h, steps, tableau, args : As in butcher.explicit_rk
+    stride     : Save every stride-th point
+    chunk_size : Number of points integrated and written per chunk
+
+    Returns:
+    out        : The memory-mapped array of shape
+                 (ceil(steps / stride) + 1, 1 + size of y)
+    """
+    chunks = explicit_rk_chunks(f, x0, y0, h, steps, tableau, args, chunk_size, stride)
+    return write_npy(path, chunks, -(-steps // stride) + 1, np.shape(y0))
+
+def load_npy(path):
+    """
+    Opens a trajectory written by write_npy without reading it into memory.
+
+    Returns:
+    xs, ys     : Memory-mapped views of the x column and the y columns
+    """
+    data = np.load(path, mmap_mode="r")
+    ys = data[:, 1] if data.shape[1] == 2 else data[:, 1:]
+    return data[:, 0], ys
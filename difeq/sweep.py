@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Set in each worker by _init_worker
+_worker = None
+
+def parameter_points(grid):
+    """
+    Names and shape of a parameter grid given as {name: sequence of values}.
+
+    Point i of the sweep is the np.unravel_index(i, shape) combination of
+    values, so the last parameter varies fastest, as in itertools.product.
+    """
+    names = list(grid)
+    values = [np.asarray(grid[name]) for name in names]
+    return names, values, tuple(len(v) for v in values)
+
+def _init_worker(func, names, values, shape, fixed, storage, out_shape, dtype):
+    global _worker
+    if storage[0] == "shm":
+        shm = shared_memory.SharedMemory(name=storage[1])
+        n = int(np.prod(shape))
+        out = np.ndarray((n,) + out_shape, dtype=dtype, buffer=shm.buf)
+        done = None
+    else:
+        shm = None
+        out = np.load(storage[1], mmap_mode="r+")
+        done = np.load(storage[2], mmap_mode="r+")
+    _worker = (func, names, values, shape, fixed, out, done, shm)
+
+def _run_chunk(bounds):
+    func, names, values, shape, fixed, out, done, _ = _worker
+    start, stop = bounds
+    index = np.unravel_index(np.arange(start, stop), shape)
+    for row, i in enumerate(range(start, stop)):
+        params = {name: v[index[k][row]] for k, (name, v) in enumerate(zip(names, values))}
+        out[i] = func(**params, **fixed)
+    if done is not None:
+        out.flush()
+        done[start:stop] = True
+        done.flush()
+    return stop - start
+
+def print_progress(done, total):
+    """
+    Default progress report: a single updating line on stderr.
+    """
+    print(f"\rsweep: {done}/{total} ({100 * done / total:.1f}%)", end="" if done < total else "\n",
+          file=sys.stderr, flush=True)
+
+def sweep(func, grid, fixed=None, out_shape=(), dtype=float, path=None, processes=None,
+          chunk_size=64, progress=None):
+    """
+    Evaluates func over a parameter grid with a process pool.
+
+    Points are handed to the workers in chunks of consecutive indices and
+    every worker writes its results straight into one shared array, so only
+    the chunk bounds are pickled. Without `path` the array lives in shared
+    memory; with `path` it is a .npy file mapped by every worker, together
+    with a <path>.done.npy mask of finished points, and calling sweep again
+    with the same path resumes by skipping the chunks that are already done.
+
+    Workers are forked where the platform allows it, so func and fixed may be
+    lambdas or closures (e.g. the f passed on to find_vertical_asymptote).
+
+    Parameters:
+    func       : Function called as func(**point, **fixed), returning a value
+                 of shape out_shape, e.g. find_as.find_vertical_asymptote
+    grid       : Dict {name: sequence of values}; the sweep covers their product
+    fixed      : Dict of keyword arguments passed to every call
+    out_shape  : Shape of one result
+    dtype      : Result dtype
+    path       : .npy file for a resumable, file-backed result (optional)
+    processes  : Number of worker processes (default: all cores)
+    chunk_size : Number of points per task
+    progress   : Function progress(done, total) called as chunks finish, e.g.
+                 print_progress
+
+    Returns:
+    results    : Array of shape grid shape + out_shape (a memmap if path is given)
+    """
+    names, values, shape = parameter_points(grid)
+    out_shape = (out_shape,) if np.isscalar(out_shape) else tuple(out_shape)
+    fixed = fixed or {}
+    total = int(np.prod(shape))
+    dtype = np.dtype(dtype)
+
+    shm = None
+    if path is None:
+        size = total * int(np.prod(out_shape)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        out = np.ndarray((total,) + out_shape, dtype=dtype, buffer=shm.buf)
+        out[...] = np.nan if dtype.kind in "fc" else 0
+        done = np.zeros(total, dtype=bool)
+        storage = ("shm", shm.name)
+    else:
+        done_path = path + ".done.npy"
+        if os.path.exists(path) and os.path.exists(done_path):
+            out = np.load(path, mmap_mode="r+")
+            if out.shape != (total,) + out_shape or out.dtype != dtype:
+                raise ValueError(f"{path} holds a different sweep: shape {out.shape}, dtype {out.dtype}")
+            done = np.load(done_path, mmap_mode="r+")
+        else:
+            out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(total,) + out_shape)
+            done = np.lib.format.open_memmap(done_path, mode="w+", dtype=bool, shape=(total,))
+            out.flush()
+            done.flush()
+        storage = ("file", path, done_path)
+
+    try:
+        chunks = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)
+                  if not done[start:start + chunk_size].all()]
+        finished = total - sum(stop - start for start, stop in chunks)
+        if progress is not None:
+            progress(finished, total)
+        if chunks:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            initargs = (func, names, values, shape, fixed, storage, out_shape, dtype)
+            with context.Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+                for count in pool.imap_unordered(_run_chunk, chunks):
+                    finished += count
+                    if progress is not None:
+                        progress(finished, total)
+        if shm is not None:
+            return out.copy().reshape(shape + out_shape)
+        return out.reshape(shape + out_shape)
+    finally:
+        if shm is not None:
+            del out
+            shm.close()
+            shm.unlink()
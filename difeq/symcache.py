@@ -0,0 +1,172 @@
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+import sympy as sp
+
+# Bump when the format or the meaning of cached operations changes; entries
+# from other versions (or other SymPy versions) are never returned
+CACHE_VERSION = 1
+
+class SymbolicCache:
+    """
+    Content-addressed on-disk cache for the results of SymPy operations.
+
+    An entry is keyed by the SHA-256 of the cache version, the SymPy version,
+    the operation name and the srepr of its arguments, and stored as a pickle
+    under `directory`. Reads refresh the file's modification time, and when
+    the cache grows past max_bytes the least recently used entries are removed.
+
+    Parameters:
+    directory : Cache directory (default $DIFEQ_CACHE_DIR or ~/.cache/difeq)
+    max_bytes : Size limit of the cache directory
+    version   : Cache version
+    max_age   : Seconds after their last use at which the directories of other
+                versions are removed; processes running another version may
+                still share the root, so those are never removed sooner
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2**20, version=CACHE_VERSION,
+                 max_age=30 * 86400):
+        root = directory or os.environ.get("DIFEQ_CACHE_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "difeq")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.directory = os.path.join(root, f"sympy-v{version}-{sp.__version__}")
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune_versions(max_age)
+
+    def prune_versions(self, max_age):
+        """
+        Removes the directories of other versions not used for max_age seconds.
+        """
+        cutoff = time.time() - max_age
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith("sympy-v") and path != self.directory and _last_used(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def key(self, operation, args=(), kwargs=None):
+        """
+        Canonical hash of an operation and its arguments.
+        """
+        items = sorted((kwargs or {}).items())
+        text = "\0".join([operation, sp.srepr(tuple(args)), sp.srepr(items)])
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key):
+        """
+        Returns (True, value) for a cached key and (False, None) otherwise.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+            # An entry evicted by another process since it was read is a miss
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        return True, value
+
+    def put(self, key, value):
+        """
+        Stores value under key, then evicts old entries beyond max_bytes.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """
+        Removes every entry of this cache version.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def call(self, func, *args, **kwargs):
+        """
+        Returns func(*args, **kwargs), from the cache when possible.
+        """
+        operation = f"{func.__module__}.{func.__qualname__}"
+        key = self.key(operation, args, kwargs)
+        hit, value = self.get(key)
+        if not hit:
+            value = func(*args, **kwargs)
+            self.put(key, value)
+        return value
+
+    def cached(self, func):
+        """
+        Decorator form of call.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        wrapper.uncached = func
+        return wrapper
+
+def _last_used(directory):
+    # Newest modification time in a cache directory (reads refresh the entries)
+    try:
+        times = [entry.stat().st_mtime for entry in os.scandir(directory)]
+        return max(times + [os.stat(directory).st_mtime])
+    except OSError:
+        return time.time()
+
+_default = None
+
+def default_cache():
+    """
+    The shared SymbolicCache in the default directory, created on first use.
+    """
+    global _default
+    if _default is None:
+        _default = SymbolicCache()
+    return _default
+
+def cached_call(func, *args, **kwargs):
+    """
+    Returns func(*args, **kwargs) through the default cache. Set the
+    environment variable DIFEQ_CACHE=off to bypass it.
+    """
+    if os.environ.get("DIFEQ_CACHE", "").lower() == "off":
+        return func(*args, **kwargs)
+    return default_cache().call(func, *args, **kwargs)
+
+def cached(func):
+    """
+    Decorator that routes every call of func through cached_call.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached_call(func, *args, **kwargs)
+    wrapper.uncached = func
+    return wrapper
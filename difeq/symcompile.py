@@ -0,0 +1,144 @@
+import hashlib
+from collections import OrderedDict
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+
+# Compiled evaluators by expression hash, least recently used first
+_compiled = OrderedDict()
+MAX_COMPILED = 256
+
+def expression_key(expr, args):
+    """
+    Hash of an expression and its argument list, used to cache compiled functions.
+    """
+    text = sp.srepr((sp.sympify(expr), tuple(args)))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def compile_expr(expr, args):
+    """
+    Compiles a SymPy expression into one fused NumPy function.
+
+    Common subexpressions are eliminated first, so the generated function
+    computes each of them once per call, and the function is cached by the
+    hash of the expression so compiling the same solution again is free.
+
+    Parameters:
+    expr : SymPy expression, e.g. y_p from varofparam.py or the general
+           solution from ap.py
+    args : Symbols in the order the function takes them, e.g. [x, C1, C2]
+
+    Returns:
+    fn   : Function fn(*values) evaluating expr with NumPy broadcasting
+    """
+    key = expression_key(expr, args)
+    fn = _compiled.get(key)
+    if fn is None:
+        fn = sp.lambdify(args, expr, modules="numpy", cse=True)
+        _compiled[key] = fn
+        if len(_compiled) > MAX_COMPILED:
+            _compiled.popitem(last=False)
+    else:
+        _compiled.move_to_end(key)
+    return fn
+
+def evaluate(fn, x, *params, out=None, chunk_size=2**18):
+    """
+    Evaluates fn(x, *params) on a large 1-D array in chunks.
+
+    Only chunk_size points are in flight at a time, so the temporaries of
+    the fused expression stay cache-sized, and results are written into out.
+
+    Parameters:
+    fn         : Compiled function from compile_expr
+    x          : 1-D array of points
+    params     : Remaining scalar arguments of fn
+    out        : Output array of the same length as x (allocated if None)
+    chunk_size : Number of points per chunk
+
+    Returns:
+    out        : The values of fn at x
+    """
+    x = np.asarray(x)
+    if out is None:
+        out = np.empty(x.shape, dtype=np.result_type(x.dtype, float))
+    for start in range(0, len(x), chunk_size):
+        stop = start + chunk_size
+        out[start:stop] = fn(x[start:stop], *params)
+    return out
+
+def compile_solution(expr, x, constants=()):
+    """
+    Convenience wrapper: compiles expr as a function of x and the given
+    constants, e.g. compile_solution(general_solution, x, C) for ap.py.
+
+    Returns:
+    fn   : Function fn(x_values, *constant_values)
+    """
+    return compile_expr(expr, [x, *constants])
+
+def rhs_symbols(expr, x=None, y=None):
+    """
+    The symbols of a right-hand side f(x, y); by default the free symbols
+    named "x" and "y".
+    """
+    names = {s.name: s for s in sp.sympify(expr).free_symbols}
+    x = x if x is not None else names.get("x", sp.Symbol("x"))
+    y = y if y is not None else names.get("y", sp.Symbol("y"))
+    return x, y
+
+def compile_rhs(expr, x=None, y=None):
+    """
+    Compiles f(x, y) from a SymPy expression.
+    """
+    return compile_expr(expr, rhs_symbols(expr, x, y))
+
+def compile_jacobian(expr, x=None, y=None):
+    """
+    Compiles df/dy(x, y) from a SymPy expression, e.g. for stiff.implicit_solve.
+    """
+    x, y = rhs_symbols(expr, x, y)
+    return compile_expr(sp.diff(expr, y), [x, y])
+
+def _rational(value):
+    return sp.Rational(Fraction(float(value)).limit_denominator(10**9))
+
+def rk_step_kernel(expr, tableau, x=None, y=None, scalar=False):
+    """
+    Generates one fused Runge-Kutta step from a SymPy right-hand side.
+
+    Every stage k_i = f(x + c_i h, y + h sum_j a_ij k_j) is substituted into
+    the update y + h sum_i b_i k_i, and the whole step is compiled with common
+    subexpression elimination, so subexpressions shared between stages (and
+    the stages themselves, which appear inside later ones) are computed once
+    and a step costs a single Python call.
+
+    Parameters:
+    expr    : SymPy expression for f(x, y)
+    tableau : butcher.Tableau of an explicit method
+    x, y    : Symbols of expr (default: the free symbols named x and y)
+    scalar  : Generate code for Python floats (math module), which is faster
+              than NumPy when y is a single number
+
+    Returns:
+    step    : Function step(x, y, h) returning y after one step of size h
+    """
+    from .butcher import tableau_key
+    x, y = rhs_symbols(expr, x, y)
+    h = sp.Dummy("h")
+    key = ("rk_step", tableau_key(tableau), scalar, expression_key(expr, [x, y]))
+    if key in _compiled:
+        _compiled.move_to_end(key)
+        return _compiled[key]
+    K = []
+    for i, c_i in enumerate(tableau.c):
+        y_stage = y + h * sum((_rational(a) * K[j] for j, a in enumerate(tableau.a[i][:i]) if a),
+                              sp.Integer(0))
+        K.append(expr.subs({x: x + _rational(c_i) * h, y: y_stage}, simultaneous=True))
+    y_next = y + h * sum((_rational(b) * K[i] for i, b in enumerate(tableau.b) if b), sp.Integer(0))
+    step = sp.lambdify([x, y, h], y_next, modules="math" if scalar else "numpy", cse=True)
+    _compiled[key] = step
+    if len(_compiled) > MAX_COMPILED:
+        _compiled.popitem(last=False)
+    return step
@@ -0,0 +1,215 @@
+import bisect
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+def _fingerprint(obj, seen=None):
+    # Stable text describing obj, descending into code objects and closures
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return "<cycle>"
+    if isinstance(obj, np.ndarray):
+        return f"ndarray({obj.dtype},{obj.shape},{hashlib.sha256(obj.tobytes()).hexdigest()})"
+    if hasattr(obj, "free_symbols") and hasattr(obj, "func"):
+        import sympy as sp
+        return sp.srepr(obj)
+    code = getattr(obj, "__code__", None)
+    if code is not None:
+        seen.add(id(obj))
+        cells = [c.cell_contents for c in (obj.__closure__ or ()) if _has_contents(c)]
+        parts = [obj.__module__ or "", obj.__qualname__, _code_text(code),
+                 _fingerprint(obj.__defaults__, seen), _fingerprint(cells, seen)]
+        return "function(" + ",".join(parts) + ")"
+    if isinstance(obj, (list, tuple)):
+        return type(obj).__name__ + "(" + ",".join(_fingerprint(o, seen) for o in obj) + ")"
+    if isinstance(obj, dict):
+        items = sorted((repr(k), _fingerprint(v, seen)) for k, v in obj.items())
+        return "dict(" + ",".join(f"{k}:{v}" for k, v in items) + ")"
+    return repr(obj)
+
+def _has_contents(cell):
+    try:
+        cell.cell_contents
+    except ValueError:
+        return False
+    return True
+
+def _code_text(code):
+    consts = ",".join(_code_text(c) if hasattr(c, "co_code") else repr(c) for c in code.co_consts)
+    return f"{code.co_code.hex()}|{consts}|{code.co_names}"
+
+def _copy(y):
+    # Checkpoints must not keep a view of a whole trajectory alive
+    return y.copy() if isinstance(y, np.ndarray) else y
+
+def function_key(f):
+    """
+    Hash identifying a right-hand side by what it computes: the bytecode,
+    constants and closure values of a Python function, or the srepr of a
+    SymPy expression. Two lambdas with the same body and captured values get
+    the same key. Global variables the function reads are identified by name
+    only, so pass changing parameters through a closure or args instead.
+    """
+    return hashlib.sha256(_fingerprint(f).encode()).hexdigest()
+
+def grid_steps(x0, h, x):
+    """
+    Number of whole steps of size h from x0 before x, robust to (x - x0) / h
+    landing just below an integer.
+    """
+    q = (x - x0) / h
+    n = round(q)
+    return n if abs(q - n) <= 1e-9 * max(1.0, abs(q)) else int(np.floor(q))
+
+class _Entry:
+    # Checkpoints of one trajectory: sorted step numbers and their states
+    def __init__(self):
+        self.steps = [0]
+        self.states = [None]
+
+class TrajectoryCache:
+    """
+    Checkpoints of fixed-step trajectories, so that integrating the same
+    initial value problem to another endpoint resumes from the nearest
+    stored state instead of starting again at x0.
+
+    A trajectory is identified by a key for the right-hand side and step
+    method, x0, y0 and the step size h; its states on the grid x0 + n*h are
+    kept every `every` steps. Whole trajectories are evicted least recently
+    used first once more than max_entries are held; with a directory they
+    are written there on eviction and read back on the next miss.
+
+    Parameters:
+    max_entries : Number of trajectories kept in memory
+    every       : Steps between checkpoints
+    directory   : Directory for the on-disk tier (optional)
+    """
+
+    def __init__(self, max_entries=64, every=256, directory=None):
+        self.max_entries = max_entries
+        self.every = every
+        self.directory = directory
+        self._entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _key(self, key, x0, y0, h):
+        y0 = np.asarray(y0, dtype=float)
+        text = "\0".join([str(key), repr(float(x0)), repr(float(h)), str(y0.shape),
+                          y0.tobytes().hex()])
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _entry(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as file:
+                    entry = pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                entry = None
+        entry = entry or _Entry()
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._spill(*self._entries.popitem(last=False))
+        return entry
+
+    def _spill(self, key, entry):
+        if self.directory is None:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+
+    def flush(self):
+        """
+        Writes every trajectory held in memory to the on-disk tier.
+        """
+        for key, entry in self._entries.items():
+            self._spill(key, entry)
+
+    def clear(self):
+        """
+        Drops every trajectory, in memory and on disk.
+        """
+        self._entries.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def state(self, key, x0, y0, h, x, advance):
+        """
+        y(x) on the trajectory from (x0, y0) with step size h.
+
+        Parameters:
+        key     : Identity of the right-hand side and step method, e.g.
+                  (function_key(f), "rk4")
+        x0      : Initial x value
+        y0      : Initial y value (scalar or array)
+        h       : Step size
+        x       : x value to integrate to (x0 + n*h, or a partial last step
+                  is taken from the grid point before it)
+        advance : Function advance(x, y, h, n) returning y after n steps of
+                  size h from (x, y)
+
+        Returns:
+        y       : The state at x
+        """
+        entry = self._entry(self._key(key, x0, y0, h))
+        if entry.states[0] is None:
+            entry.states[0] = _copy(y0)
+        n = grid_steps(x0, h, x)
+        if n < 0:
+            raise ValueError(f"x = {x} lies before x0 = {x0}")
+        k = bisect.bisect_right(entry.steps, n) - 1
+        m, y = entry.steps[k], entry.states[k]
+        # Step to every checkpoint between the nearest stored one and n
+        while m < n:
+            stop = min(n, (m // self.every + 1) * self.every)
+            y = advance(x0 + m * h, y, h, stop - m)
+            m = stop
+            if m % self.every == 0:
+                i = bisect.bisect_left(entry.steps, m)
+                if i == len(entry.steps) or entry.steps[i] != m:
+                    entry.steps.insert(i, m)
+                    entry.states.insert(i, _copy(y))
+        remainder = x - (x0 + n * h)
+        if abs(remainder) > 1e-12 * max(1.0, abs(x)):
+            y = advance(x0 + n * h, y, remainder, 1)
+        return y
+
+    def integrate(self, f, x0, y0, h, x, tableau="rk4", args=()):
+        """
+        y(x) for y' = f(x, y, *args) with a fixed-step Runge-Kutta method,
+        resuming from the nearest checkpoint (see butcher.explicit_rk).
+        """
+        from .butcher import TABLEAUX, explicit_rk, tableau_key
+        tableau = TABLEAUX[tableau] if isinstance(tableau, str) else tableau
+
+        def advance(x, y, h, n):
+            return explicit_rk(f, x, y, h, n, tableau, args)[1][-1]
+
+        key = (function_key(f), tableau_key(tableau), function_key(args))
+        return self.state(key, x0, y0, h, x, advance)
+
+_default = None
+
+def default_cache():
+    """
+    The shared in-memory TrajectoryCache, created on first use.
+    """
+    global _default
+    if _default is None:
+        _default = TrajectoryCache()
+    return _default
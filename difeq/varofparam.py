@@ -0,0 +1,175 @@
+import sympy as sp
+
+from .symcache import cached, cached_call
+
+def _tidy(expr):
+    # Targeted simplification: merge products of exponentials, apply the
+    # trigonometric identities when there are trigonometric functions, and
+    # group the result by exponential factor instead of running a global simplify
+    expr = sp.powsimp(sp.expand(expr), combine="exp")
+    if expr.has(sp.sin, sp.cos, sp.tan, sp.cot, sp.sec, sp.csc):
+        expr = sp.powsimp(sp.trigsimp(expr), combine="exp")
+    return sp.collect(expr, list(expr.atoms(sp.exp)))
+
+def _tidy_all(exprs):
+    # _tidy for a list of expressions that share subexpressions (such as the
+    # cofactors of one matrix): the common subexpressions found by cse are
+    # tidied once, then every expression is tidied with them substituted back
+    replacements, reduced = sp.cse(list(exprs))
+    values = {}
+    for symbol, sub in replacements:
+        values[symbol] = _tidy(sub.xreplace(values))
+    return [_tidy(expr.xreplace(values)) for expr in reduced]
+
+def wronskian_matrix(basis, x):
+    """
+    Wronskian matrix of the functions in basis: row k holds their k-th derivatives.
+    """
+    rows = [list(basis)]
+    for _ in range(len(basis) - 1):
+        rows.append([sp.diff(yi, x) for yi in rows[-1]])
+    return sp.Matrix(rows)
+
+@cached
+def variation_of_parameters_coefficients(basis, g, x, p=None, x0=0):
+    """
+    Computes W and u_i' for y^(n) + p(x) y^(n-1) + ... = g(x).
+
+    The u_i' solve Wronskian_matrix * u' = [0, ..., 0, g], so they are g/W
+    times the last column of the adjugate, i.e. the cofactors of the last row
+    of the Wronskian matrix. The same cofactors give W by Laplace expansion
+    along the last row, so no separate determinant is needed. When p is given,
+    Abel's formula W(x) = W(x0) exp(-integral of p from x0 to x) is used instead.
+
+    Parameters:
+    basis : List of n homogeneous solutions y_1, ..., y_n
+    g     : Nonhomogeneous term (the equation must have leading coefficient 1)
+    x     : The independent variable
+    p     : Coefficient of y^(n-1), for Abel's formula (optional)
+    x0    : Point at which W is evaluated for Abel's formula
+
+    Returns:
+    W        : The Wronskian
+    u_primes : List of u_i'
+    """
+    n = len(basis)
+    M = wronskian_matrix(basis, x)
+    minors = M[:n - 1, :]
+    cofactors = _tidy_all((-1) ** (n - 1 + i) * minors[:, [j for j in range(n) if j != i]].det()
+                          for i in range(n))
+    W = sum(M[n - 1, i] * cofactors[i] for i in range(n))
+    if p is not None:
+        t = sp.Dummy("t")
+        W = W.subs(x, x0) * sp.exp(-sp.integrate(sp.sympify(p).subs(x, t), (t, x0, x)))
+    # W is a single small expression: simplify it once, before dividing by it
+    W = sp.factor(_tidy(W))
+    u_primes = [_tidy(sp.cancel(cofactors[i] / W) * g) for i in range(n)]
+    return W, u_primes
+
+@cached
+def variation_of_parameters(basis, g, x, p=None, x0=0):
+    """
+    Particular solution of y^(n) + p(x) y^(n-1) + ... = g(x) by variation of
+    parameters, for any order n.
+
+    Parameters:
+    basis : List of n homogeneous solutions y_1, ..., y_n
+    g     : Nonhomogeneous term (the equation must have leading coefficient 1)
+    x     : The independent variable
+    p     : Coefficient of y^(n-1), for Abel's formula (optional)
+    x0    : Point at which W is evaluated for Abel's formula
+
+    Returns:
+    y_p   : The particular solution sum(u_i * y_i)
+    """
+    _, u_primes = variation_of_parameters_coefficients(basis, g, x, p, x0)
+    us = [sp.integrate(u_prime, x) for u_prime in u_primes]
+    return _tidy(sum(u * yi for u, yi in zip(us, basis)))
+
+def main():
+    # Define the variable and function
+    x = sp.symbols('x')
+    y = sp.Function('y')
+
+    # Define the nonhomogeneous term
+    g = sp.exp(-6 * x)
+
+    # Define the homogeneous differential equation y''' + 9 y'' - 108 y = 0
+    # We'll find the complementary (homogeneous) solution first
+
+    # Define the characteristic equation
+    r = sp.symbols('r')
+    char_eq = sp.Eq(r**3 + 9*r**2 - 108, 0)
+
+    # Solve the characteristic equation for roots
+    roots = cached_call(sp.solve, char_eq, r)
+    print("Roots of the characteristic equation:", roots)
+
+    # Based on the roots, define the homogeneous solutions
+    # Assume roots are distinct or repeated as necessary
+    # For example purposes, let's compute them symbolically
+
+    # Find numerical roots for clarity (if necessary)
+    # If roots are not easily factorizable, SymPy will keep them symbolic
+    # For this example, one real root and a double real root
+    # Let's factor the equation if possible
+
+    # Factor the characteristic equation
+    factored_eq = cached_call(sp.factor, r**3 + 9*r**2 - 108)
+    print("Factored characteristic equation:", factored_eq)
+
+    # From factoring, we find that r = 3 is a root
+    # Perform polynomial division or use SymPy to factor further
+    # r = 3 is a root, so divide the polynomial by (r - 3)
+    divided_poly = cached_call(sp.div, r**3 + 9*r**2 - 108, (r - 3))
+    print("Division result:", divided_poly)
+
+    # The characteristic equation factors as (r - 3)(r^2 + 12r + 36) = 0
+    # Solve r^2 + 12r + 36 = 0 for the remaining roots
+    remaining_roots = cached_call(sp.solve, r**2 + 12*r + 36, r)
+    print("Remaining roots:", remaining_roots)
+
+    # Thus, the roots are r = 3, r = -6 (double root)
+    # Define homogeneous solutions accordingly
+    y1 = sp.exp(3 * x)
+    y2 = sp.exp(-6 * x)
+    y3 = x * sp.exp(-6 * x)  # Multiply by x for the repeated root
+
+    # Display homogeneous solutions
+    print("Homogeneous Solutions:")
+    print("y1 =", y1)
+    print("y2 =", y2)
+    print("y3 =", y3)
+
+    # Compute the Wronskian and u1', u2', u3' using Variation of Parameters
+    # The system is:
+    # y1*u1' + y2*u2' + y3*u3' = 0
+    # y1'*u1' + y2'*u2' + y3'*u3' = 0
+    # y1''*u1' + y2''*u2' + y3''*u3' = g(x)
+    # The equation has p(x) = 9 as the coefficient of y'', so W follows from Abel's formula
+    W, (u1_prime, u2_prime, u3_prime) = variation_of_parameters_coefficients([y1, y2, y3], g, x, p=9)
+    print("\nWronskian (W):")
+    print(sp.pretty(W))
+
+    print("\nu1' =", u1_prime)
+    print("u2' =", u2_prime)
+    print("u3' =", u3_prime)
+
+    # Integrate to find u1, u2, u3
+    u1 = cached_call(sp.integrate, u1_prime, x)
+    u2 = cached_call(sp.integrate, u2_prime, x)
+    u3 = cached_call(sp.integrate, u3_prime, x)
+
+    print("\nu1 =", u1)
+    print("u2 =", u2)
+    print("u3 =", u3)
+
+    # The particular solution y_p is given by:
+    # y_p = u1*y1 + u2*y2 + u3*y3
+    y_p = cached_call(_tidy, u1 * y1 + u2 * y2 + u3 * y3)
+
+    print("\nThe particular solution y_p(x) is:")
+    print(sp.pretty(y_p))
+
+if __name__ == "__main__":
+    main()